@@ -7,7 +7,7 @@ This will generate a set of tiles at a specific resolution around a center point
 import os
 import json
 import h3
-from hexglobe.models.tile import TileData, VisualProperties
+from hexglobe.models.tile import VisualProperties
 from hexglobe.models.tile import HexagonTile, PentagonTile
 
 def create_sample_tiles():
@@ -42,7 +42,7 @@ def create_sample_tiles():
             tile = HexagonTile(index, f"Sample content for hexagon {index}")
             
         # Set visual properties
-        for prop_name, prop_value in visual_props.dict().items():
+        for prop_name, prop_value in visual_props.to_dict().items():
             tile.set_visual_property(prop_name, prop_value)
             
         # Save using the new split format methods
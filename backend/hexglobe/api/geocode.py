@@ -3,11 +3,8 @@ from typing import Dict, Optional
 import h3
 import logging
 import requests
-from datetime import datetime
 import time
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
@@ -22,7 +19,7 @@ geocode_cache = {}
 CACHE_EXPIRY = 86400  # 24 hours in seconds
 
 @router.get("/")
-async def geocode_address(
+def geocode_address(
     address: Optional[str] = Query(None, description="Address to geocode"),
     lat: Optional[float] = Query(None, description="Latitude coordinate"),
     lng: Optional[float] = Query(None, description="Longitude coordinate"),
@@ -37,7 +34,7 @@ async def geocode_address(
     
     It returns the corresponding H3 index at the specified resolution.
     """
-    logger.info(f"[{datetime.now()}] Geocode request received")
+    logger.info("Geocode request received")
     
     try:
         # Input validation
@@ -49,12 +46,12 @@ async def geocode_address(
         
         # If resolution is out of bounds, use default
         if resolution < 0 or resolution > 15:
-            logger.warning(f"[{datetime.now()}] Invalid resolution: {resolution}, using default (9)")
+            logger.warning("Invalid resolution: %s, using default (9)", resolution)
             resolution = 9
         
         # Case 1: Coordinates provided directly
         if lat is not None and lng is not None:
-            logger.info(f"[{datetime.now()}] Converting coordinates ({lat}, {lng}) to H3 index")
+            logger.info("Converting coordinates (%s, %s) to H3 index", lat, lng)
             h3_index = h3.geo_to_h3(lat, lng, resolution)
             return {
                 "h3_index": h3_index,
@@ -68,7 +65,7 @@ async def geocode_address(
         if address in geocode_cache:
             cache_entry = geocode_cache[address]
             if current_time - cache_entry["timestamp"] < CACHE_EXPIRY:
-                logger.info(f"[{datetime.now()}] Cache hit for address: {address}")
+                logger.info("Cache hit for address: %s", address)
                 lat, lng = cache_entry["lat"], cache_entry["lng"]
                 h3_index = h3.geo_to_h3(lat, lng, resolution)
                 return {
@@ -80,7 +77,7 @@ async def geocode_address(
                 }
         
         # Not in cache or expired, query Nominatim
-        logger.info(f"[{datetime.now()}] Geocoding address: {address}")
+        logger.info("Geocoding address: %s", address)
         
         # Call Nominatim API with appropriate headers
         headers = {
@@ -101,7 +98,7 @@ async def geocode_address(
         
         # Check if request was successful
         if response.status_code != 200:
-            logger.error(f"[{datetime.now()}] Nominatim API error: {response.status_code}")
+            logger.error("Nominatim API error: %s", response.status_code)
             raise HTTPException(
                 status_code=502,
                 detail=f"Geocoding service error: {response.status_code}"
@@ -110,7 +107,7 @@ async def geocode_address(
         # Parse response
         results = response.json()
         if not results:
-            logger.warning(f"[{datetime.now()}] No results found for address: {address}")
+            logger.warning("No results found for address: %s", address)
             raise HTTPException(
                 status_code=404,
                 detail=f"No location found for address: {address}"
@@ -132,7 +129,7 @@ async def geocode_address(
         # Convert to H3 index
         h3_index = h3.geo_to_h3(lat, lng, resolution)
         
-        logger.info(f"[{datetime.now()}] Successfully geocoded address to H3 index: {h3_index}")
+        logger.info("Successfully geocoded address to H3 index: %s", h3_index)
         
         return {
             "h3_index": h3_index,
@@ -146,5 +143,5 @@ async def geocode_address(
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error processing geocode request: {str(e)}")
+        logger.error("Error processing geocode request: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,15 +1,27 @@
 from fastapi import APIRouter, HTTPException, Path, Query
-from typing import Dict, List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import bisect
+import asyncio
+import functools
 import h3
+import json
 import logging
-from datetime import datetime
 import os
 import math
+import re
 
-from ..models.tile import Tile, HexagonTile, PentagonTile, VisualProperties, get_latest_hex_map_path
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the standard library encoder is used without it
+    orjson = None
+
+from ..models.tile import (
+    Tile, TileUpdate, VisualProperties, VisualPropertiesUpdate,
+    get_latest_hex_map_path, make_tile
+)
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
@@ -18,17 +30,102 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Project root, used to turn hex map paths into paths relative to the frontend
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Memoized H3 validity check; a pure function of the index, so the results
+# never go stale and repeat lookups skip the call into libh3
+_h3_is_valid_cell = functools.lru_cache(maxsize=1 << 16)(h3.h3_is_valid)
+
+# H3 cell indexes are 15 hex digits. libh3 also accepts anything int(x, 16)
+# parses (prefixes, whitespace, underscores), which would break storage paths
+_H3_INDEX_RE = re.compile(r"[0-9a-fA-F]{15}")
+
+def _h3_is_valid(h3_index: str) -> bool:
+    """
+    Check whether a string is a valid H3 cell index.
+    
+    Malformed strings are rejected by a precompiled pattern before the
+    memoized libh3 check, which also keeps them out of its cache.
+    """
+    return _H3_INDEX_RE.fullmatch(h3_index) is not None and _h3_is_valid_cell(h3_index)
+
+# The 12 pentagons of every resolution; the H3 topology is fixed, so pentagon
+# checks become set lookups
+PENTAGON_IDS = {resolution: frozenset(h3.get_pentagon_indexes(resolution)) for resolution in range(16)}
+
+# Pentagon centers of every resolution, for the distance prefilter in _build_grid
+_PENTAGON_CENTERS = {
+    resolution: tuple(h3.h3_to_geo(pentagon) for pentagon in pentagon_ids)
+    for resolution, pentagon_ids in PENTAGON_IDS.items()
+}
+
+# Adjacent cell centers are at most ~2.2 average edge lengths apart anywhere
+# on the globe; 3 leaves a safety margin for the prefilter
+_MAX_STEP_EDGE_LENGTHS = 3
+
+# Base cells that are pentagons; a cell is a pentagon exactly when it lies on
+# one of these and all of its resolution digits are zero
+_PENTAGON_BASE_CELLS = frozenset(h3.h3_get_base_cell(pentagon) for pentagon in PENTAGON_IDS[0])
+
+def _classify(h3_index: str) -> Tuple[int, bool, int]:
+    """
+    Parse a valid H3 index once and classify it with bit operations.
+    
+    Args:
+        h3_index: A valid H3 index
+        
+    Returns:
+        A tuple of the integer index, whether it is a pentagon, and its resolution
+    """
+    h3_int = int(h3_index, 16)
+    resolution = (h3_int >> 52) & 0xF
+    base_cell = (h3_int >> 45) & 0x7F
+    # The digits of resolutions 1..resolution, 3 bits each, below the base cell
+    digits = (h3_int >> (3 * (15 - resolution))) & ((1 << (3 * resolution)) - 1)
+    return h3_int, base_cell in _PENTAGON_BASE_CELLS and digits == 0, resolution
+
+def _pentagon_may_be_near(h3_index: str, resolution: int, k: int) -> bool:
+    """
+    Conservatively check whether a pentagon could be within k steps of a cell.
+    
+    Every step moves the cell center by a bounded distance, so a cell whose
+    center is further than that from all pentagon centers of its resolution
+    cannot have a pentagon in its k-ring. This avoids building the k-ring in
+    the common case of a grid far away from any pentagon.
+    
+    Args:
+        h3_index: A valid H3 index
+        resolution: The resolution of the index
+        k: The k-ring distance
+        
+    Returns:
+        False if no pentagon can be within k steps, True if one might be
+    """
+    center = h3.h3_to_geo(h3_index)
+    reach_km = (k + 1) * _MAX_STEP_EDGE_LENGTHS * h3.edge_length(resolution, "km")
+    return any(h3.point_dist(center, pentagon_center, "km") <= reach_km
+               for pentagon_center in _PENTAGON_CENTERS[resolution])
+
+# Relative (row, col) grid offset of each neighbor position, indexed by
+# [column parity][index in Tile.NEIGHBOR_POSITIONS]; odd columns are shifted
+# half a row up
+_DELTA = (
+    ((-1, 0), (-1, -1), (0, -1), (1, 0), (0, 1), (-1, 1)),  # Even columns
+    ((-1, 0), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1)),  # Odd columns
+)
+
 @router.get("/{tile_id}")
-async def get_tile(
+def get_tile(
     tile_id: str = Path(..., description="H3 index of the tile"),
     mod_name: str = Query("default", description="Name of the mod/application")
 ):
     """Get information about a specific tile."""
-    logger.info(f"[{datetime.now()}] GET request received for tile: {tile_id}, mod: {mod_name}")
+    logger.info("GET request received for tile: %s, mod: %s", tile_id, mod_name)
     try:
         # Validate the H3 index
-        if not h3.h3_is_valid(tile_id):
-            logger.warning(f"[{datetime.now()}] Invalid H3 index: {tile_id}")
+        if not _h3_is_valid(tile_id):
+            logger.warning("Invalid H3 index: %s", tile_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
         # Try to load from storage
@@ -36,38 +133,29 @@ async def get_tile(
         
         # If not found in storage, create a new one
         if tile is None:
-            logger.info(f"[{datetime.now()}] Tile {tile_id} not found in storage, creating new tile")
-            if h3.h3_is_pentagon(tile_id):
-                tile = PentagonTile(tile_id)
-            else:
-                tile = HexagonTile(tile_id)
+            logger.info("Tile %s not found in storage, creating new tile", tile_id)
+            tile = make_tile(tile_id)
             
             # Save only the static data for the newly created tile
             tile.save_static()
-            logger.info(f"[{datetime.now()}] New tile {tile_id} static data saved to storage")
+            logger.info("New tile %s static data saved to storage", tile_id)
             
             # Create all tiles within a distance of 5 to ensure grid is populated
-            logger.info(f"[{datetime.now()}] Creating neighbor tiles within distance 5 of {tile_id}")
+            logger.info("Creating neighbor tiles within distance 5 of %s", tile_id)
             neighbor_tiles = h3.k_ring(tile_id, 5)
-            created_count = 0
             
-            for neighbor_id in neighbor_tiles:
-                if neighbor_id == tile_id:
-                    continue  # Skip the center tile
-                    
-                # Check if neighbor already exists
-                if Tile.load(neighbor_id, mod_name) is None:
-                    # Create and save the neighbor tile (static data only)
-                    if h3.h3_is_pentagon(neighbor_id):
-                        neighbor_tile = PentagonTile(neighbor_id)
-                    else:
-                        neighbor_tile = HexagonTile(neighbor_id)
-                    neighbor_tile.save_static()
-                    created_count += 1
+            # Check which neighbors already exist in one pass
+            existing_ids = Tile.existing_ids(neighbor_tiles)
+            
+            # Create and save the missing neighbor tiles (static data only), skipping the center tile
+            missing_ids = [neighbor_id for neighbor_id in neighbor_tiles
+                           if neighbor_id != tile_id and neighbor_id not in existing_ids]
+            Tile.save_static_many([make_tile(neighbor_id) for neighbor_id in missing_ids])
+            created_count = len(missing_ids)
             
-            logger.info(f"[{datetime.now()}] Created {created_count} new neighbor tiles for {tile_id}")
+            logger.info("Created %s new neighbor tiles for %s", created_count, tile_id)
         else:
-            logger.info(f"[{datetime.now()}] Tile {tile_id} loaded from storage")
+            logger.info("Tile %s loaded from storage", tile_id)
         
         # Get the tile data
         tile_data = tile.to_dict()
@@ -76,89 +164,84 @@ async def get_tile(
         latest_map_path = get_latest_hex_map_path(tile_id)
         if latest_map_path:
             # Convert to relative path for frontend use
-            relative_path = os.path.relpath(latest_map_path, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+            relative_path = os.path.relpath(latest_map_path, _PROJECT_ROOT)
             tile_data["latest_map"] = relative_path
         
         return tile_data
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error processing request for tile {tile_id}: {str(e)}")
+        logger.error("Error processing request for tile %s: %s", tile_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/{tile_id}")
-async def update_tile(
-    tile_data: Dict,
+def update_tile(
+    tile_data: TileUpdate,
     tile_id: str = Path(..., description="H3 index of the tile"),
     mod_name: str = Query("default", description="Name of the mod/application")
 ):
     """Update tile information."""
-    logger.info(f"[{datetime.now()}] PUT request received to update tile: {tile_id}, mod: {mod_name}")
+    logger.info("PUT request received to update tile: %s, mod: %s", tile_id, mod_name)
     try:
         # Validate the H3 index
-        if not h3.h3_is_valid(tile_id):
-            logger.warning(f"[{datetime.now()}] Invalid H3 index: {tile_id}")
+        if not _h3_is_valid(tile_id):
+            logger.warning("Invalid H3 index: %s", tile_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
         # Load or create the tile
         tile = Tile.load(tile_id, mod_name)
         if tile is None:
-            logger.info(f"[{datetime.now()}] Tile {tile_id} not found in storage, creating new one")
-            if h3.h3_is_pentagon(tile_id):
-                tile = PentagonTile(tile_id)
-            else:
-                tile = HexagonTile(tile_id)
+            logger.info("Tile %s not found in storage, creating new one", tile_id)
+            tile = make_tile(tile_id)
             
             # Save the static data for the newly created tile
             tile.save_static()
-            logger.info(f"[{datetime.now()}] New tile {tile_id} static data saved to storage")
+            logger.info("New tile %s static data saved to storage", tile_id)
         
-        # Update content if provided
-        if "content" in tile_data:
-            tile.content = tile_data["content"]
-        
-        # Update visual properties if provided
-        if "visual_properties" in tile_data:
-            visual_props = tile_data["visual_properties"]
-            for prop_name, prop_value in visual_props.items():
-                tile.set_visual_property(prop_name, prop_value)
+        # Update content and visual properties if provided
+        tile.apply(tile_data)
         
         # Save the dynamic data since we've updated content or visual properties
         tile.save_dynamic(mod_name)
-        logger.info(f"[{datetime.now()}] Updated tile {tile_id} dynamic data saved for mod {mod_name}")
+        logger.info("Updated tile %s dynamic data saved for mod %s", tile_id, mod_name)
         
         return {"message": "Tile updated successfully", "tile": tile.to_dict()}
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error updating tile {tile_id}: {str(e)}")
+        logger.error("Error updating tile %s: %s", tile_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{tile_id}/neighbors")
-async def get_neighbors(
+def get_neighbors(
     tile_id: str = Path(..., description="H3 index of the tile"),
     mod_name: str = Query("default", description="Name of the mod/application")
 ):
     """Get neighboring tiles with their positions."""
-    logger.info(f"[{datetime.now()}] GET request received for neighbors of tile: {tile_id}, mod: {mod_name}")
+    logger.info("GET request received for neighbors of tile: %s, mod: %s", tile_id, mod_name)
     try:
         # Validate the H3 index
-        if not h3.h3_is_valid(tile_id):
-            logger.warning(f"[{datetime.now()}] Invalid H3 index: {tile_id}")
+        if not _h3_is_valid(tile_id):
+            logger.warning("Invalid H3 index: %s", tile_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
         # Load or create the tile
         tile = Tile.load(tile_id, mod_name)
         if tile is None:
-            logger.info(f"[{datetime.now()}] Tile {tile_id} not found in storage, creating new one")
-            if h3.h3_is_pentagon(tile_id):
-                tile = PentagonTile(tile_id)
-            else:
-                tile = HexagonTile(tile_id)
+            logger.info("Tile %s not found in storage, creating new one", tile_id)
+            tile = make_tile(tile_id)
             
             # Save the static data for the newly created tile
             tile.save_static()
-            logger.info(f"[{datetime.now()}] New tile {tile_id} static data saved to storage")
+            logger.info("New tile %s static data saved to storage", tile_id)
+        
+        # Load all stored neighbors in one batch, then create the missing ones together
+        neighbor_ids = [neighbor_id for neighbor_id in tile.neighbor_ids if neighbor_id != "pentagon"]
+        loaded_neighbors = Tile.load_many(neighbor_ids, mod_name)
+        missing_ids = [neighbor_id for neighbor_id in neighbor_ids if neighbor_id not in loaded_neighbors]
+        created_neighbors = [make_tile(neighbor_id) for neighbor_id in missing_ids]
+        Tile.save_static_many(created_neighbors)
+        loaded_neighbors.update(zip(missing_ids, created_neighbors))
         
         # Get neighbors with positions
         neighbor_data = {}
-        for position, neighbor_id in tile.neighbor_ids.items():
+        for position, neighbor_id in zip(tile.NEIGHBOR_POSITIONS, tile.neighbor_ids):
             if neighbor_id == "pentagon":
                 # For pentagon placeholders, add special entry
                 neighbor_data[position] = {
@@ -166,159 +249,138 @@ async def get_neighbors(
                     "is_pentagon_placeholder": True
                 }
             else:
-                # Load or create the neighbor tile
-                neighbor_tile = Tile.load(neighbor_id, mod_name)
-                if neighbor_tile is None:
-                    if h3.h3_is_pentagon(neighbor_id):
-                        neighbor_tile = PentagonTile(neighbor_id)
-                    else:
-                        neighbor_tile = HexagonTile(neighbor_id)
-                    neighbor_tile.save_static()
-                
                 # Add neighbor data with position
-                neighbor_data[position] = neighbor_tile.to_dict()
+                neighbor_data[position] = loaded_neighbors[neighbor_id].to_dict()
         
-        logger.info(f"[{datetime.now()}] Found {len(neighbor_data)} neighbors for tile {tile_id}")
+        logger.info("Found %s neighbors for tile %s", len(neighbor_data), tile_id)
         
         return {
             "tile_id": tile_id,
             "neighbors": neighbor_data
         }
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error getting neighbors for tile {tile_id}: {str(e)}")
+        logger.error("Error getting neighbors for tile %s: %s", tile_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{tile_id}/parent")
-async def get_parent(
+def get_parent(
     tile_id: str = Path(..., description="H3 index of the tile"),
     mod_name: str = Query("default", description="Name of the mod/application")
 ):
     """Get parent tile."""
-    logger.info(f"[{datetime.now()}] GET request received for parent of tile: {tile_id}, mod: {mod_name}")
+    logger.info("GET request received for parent of tile: %s, mod: %s", tile_id, mod_name)
     try:
         # Validate the H3 index
-        if not h3.h3_is_valid(tile_id):
-            logger.warning(f"[{datetime.now()}] Invalid H3 index: {tile_id}")
+        if not _h3_is_valid(tile_id):
+            logger.warning("Invalid H3 index: %s", tile_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
         # Load or create the tile
         tile = Tile.load(tile_id, mod_name)
         if tile is None:
-            logger.info(f"[{datetime.now()}] Tile {tile_id} not found in storage, creating new one")
-            if h3.h3_is_pentagon(tile_id):
-                tile = PentagonTile(tile_id)
-            else:
-                tile = HexagonTile(tile_id)
+            logger.info("Tile %s not found in storage, creating new one", tile_id)
+            tile = make_tile(tile_id)
             
             # Save the static data for the newly created tile
             tile.save_static()
-            logger.info(f"[{datetime.now()}] New tile {tile_id} static data saved to storage")
+            logger.info("New tile %s static data saved to storage", tile_id)
         
         # Get parent
         parent = tile.get_parent()
         
         if parent is None:
-            logger.info(f"[{datetime.now()}] No parent found for tile {tile_id}")
+            logger.info("No parent found for tile %s", tile_id)
             return {"tile_id": tile_id, "parent": None}
         
-        logger.info(f"[{datetime.now()}] Found parent {parent.id} for tile {tile_id}")
+        logger.info("Found parent %s for tile %s", parent.id, tile_id)
         return {
             "tile_id": tile_id,
             "parent": parent.to_dict()
         }
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error getting parent for tile {tile_id}: {str(e)}")
+        logger.error("Error getting parent for tile %s: %s", tile_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{tile_id}/children")
-async def get_children(
+def get_children(
     tile_id: str = Path(..., description="H3 index of the tile"),
     mod_name: str = Query("default", description="Name of the mod/application")
 ):
     """Get child tiles."""
-    logger.info(f"[{datetime.now()}] GET request received for children of tile: {tile_id}, mod: {mod_name}")
+    logger.info("GET request received for children of tile: %s, mod: %s", tile_id, mod_name)
     try:
         # Validate the H3 index
-        if not h3.h3_is_valid(tile_id):
-            logger.warning(f"[{datetime.now()}] Invalid H3 index: {tile_id}")
+        if not _h3_is_valid(tile_id):
+            logger.warning("Invalid H3 index: %s", tile_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
         # Load or create the tile
         tile = Tile.load(tile_id, mod_name)
         if tile is None:
-            logger.info(f"[{datetime.now()}] Tile {tile_id} not found in storage, creating new one")
-            if h3.h3_is_pentagon(tile_id):
-                tile = PentagonTile(tile_id)
-            else:
-                tile = HexagonTile(tile_id)
+            logger.info("Tile %s not found in storage, creating new one", tile_id)
+            tile = make_tile(tile_id)
             
             # Save the static data for the newly created tile
             tile.save_static()
-            logger.info(f"[{datetime.now()}] New tile {tile_id} static data saved to storage")
+            logger.info("New tile %s static data saved to storage", tile_id)
         
         # Get children
         children = tile.get_children()
-        logger.info(f"[{datetime.now()}] Found {len(children)} children for tile {tile_id}")
+        logger.info("Found %s children for tile %s", len(children), tile_id)
         
         return {
             "tile_id": tile_id,
             "children": [c.to_dict() for c in children]
         }
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error getting children for tile {tile_id}: {str(e)}")
+        logger.error("Error getting children for tile %s: %s", tile_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{tile_id}/move-content/{target_id}")
-async def move_content(
+def move_content(
     tile_id: str = Path(..., description="Source H3 index"),
     target_id: str = Path(..., description="Target H3 index"),
     mod_name: str = Query("default", description="Name of the mod/application")
 ):
     """Move content from one tile to another."""
-    logger.info(f"[{datetime.now()}] POST request received to move content from tile {tile_id} to {target_id}, mod: {mod_name}")
+    logger.info("POST request received to move content from tile %s to %s, mod: %s", tile_id, target_id, mod_name)
     try:
         # Validate the H3 indices
-        if not h3.h3_is_valid(tile_id) or not h3.h3_is_valid(target_id):
-            logger.warning(f"[{datetime.now()}] Invalid H3 index: source={tile_id}, target={target_id}")
+        if not _h3_is_valid(tile_id) or not _h3_is_valid(target_id):
+            logger.warning("Invalid H3 index: source=%s, target=%s", tile_id, target_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
         # Load or create the source tile
         source_tile = Tile.load(tile_id, mod_name)
         if source_tile is None:
-            logger.info(f"[{datetime.now()}] Source tile {tile_id} not found in storage, creating new one")
-            if h3.h3_is_pentagon(tile_id):
-                source_tile = PentagonTile(tile_id)
-            else:
-                source_tile = HexagonTile(tile_id)
+            logger.info("Source tile %s not found in storage, creating new one", tile_id)
+            source_tile = make_tile(tile_id)
             
             # Save the static data for the newly created tile
             source_tile.save_static()
-            logger.info(f"[{datetime.now()}] New source tile {tile_id} static data saved to storage")
+            logger.info("New source tile %s static data saved to storage", tile_id)
         
         # Load or create the target tile
         target_tile = Tile.load(target_id, mod_name)
         if target_tile is None:
-            logger.info(f"[{datetime.now()}] Target tile {target_id} not found in storage, creating new one")
-            if h3.h3_is_pentagon(target_id):
-                target_tile = PentagonTile(target_id)
-            else:
-                target_tile = HexagonTile(target_id)
+            logger.info("Target tile %s not found in storage, creating new one", target_id)
+            target_tile = make_tile(target_id)
             
             # Save the static data for the newly created tile
             target_tile.save_static()
-            logger.info(f"[{datetime.now()}] New target tile {target_id} static data saved to storage")
+            logger.info("New target tile %s static data saved to storage", target_id)
         
         # Move content
-        success = source_tile.move_content_to(target_tile)
+        success = source_tile.move_content_to(target_tile, mod_name)
         
         if not success:
-            logger.warning(f"[{datetime.now()}] Content could not be moved from {tile_id} to {target_id}")
+            logger.warning("Content could not be moved from %s to %s", tile_id, target_id)
             raise HTTPException(
                 status_code=400,
                 detail="Content could not be moved. There may be an issue with the target tile."
             )
         
-        logger.info(f"[{datetime.now()}] Content successfully moved from {tile_id} to {target_id}")
+        logger.info("Content successfully moved from %s to %s", tile_id, target_id)
         return {
             "message": "Content moved successfully",
             "source_tile": {
@@ -333,44 +395,36 @@ async def move_content(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error moving content from {tile_id} to {target_id}: {str(e)}")
+        logger.error("Error moving content from %s to %s: %s", tile_id, target_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/{tile_id}/visual")
-async def update_visual_properties(
-    visual_props: Dict,
+def update_visual_properties(
+    visual_props: VisualPropertiesUpdate,
     tile_id: str = Path(..., description="H3 index of the tile"),
     mod_name: str = Query("default", description="Name of the mod/application")
 ):
     """Update visual properties of a tile."""
-    logger.info(f"[{datetime.now()}] PUT request received to update visual properties of tile: {tile_id}, mod: {mod_name}")
+    logger.info("PUT request received to update visual properties of tile: %s, mod: %s", tile_id, mod_name)
     try:
         # Validate the H3 index
-        if not h3.h3_is_valid(tile_id):
-            logger.warning(f"[{datetime.now()}] Invalid H3 index: {tile_id}")
+        if not _h3_is_valid(tile_id):
+            logger.warning("Invalid H3 index: %s", tile_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
         # Load or create the tile
         tile = Tile.load(tile_id, mod_name)
         if tile is None:
-            logger.info(f"[{datetime.now()}] Tile {tile_id} not found in storage, creating new one")
-            if h3.h3_is_pentagon(tile_id):
-                tile = PentagonTile(tile_id)
-            else:
-                tile = HexagonTile(tile_id)
+            logger.info("Tile %s not found in storage, creating new one", tile_id)
+            tile = make_tile(tile_id)
             
             # Save the static data for the newly created tile
             tile.save_static()
-            logger.info(f"[{datetime.now()}] New tile {tile_id} static data saved to storage")
+            logger.info("New tile %s static data saved to storage", tile_id)
         
         # Update visual properties
-        updated = False
-        for key, value in visual_props.items():
-            if tile.set_visual_property(key, value):
-                updated = True
-        
-        if not updated:
-            logger.warning(f"[{datetime.now()}] No valid visual properties provided for tile {tile_id}")
+        if not tile.apply_visual_properties(visual_props):
+            logger.warning("No valid visual properties provided for tile %s", tile_id)
             raise HTTPException(
                 status_code=400,
                 detail="No valid visual properties provided"
@@ -378,7 +432,7 @@ async def update_visual_properties(
         
         # Save the dynamic data since we've updated visual properties
         tile.save_dynamic(mod_name)
-        logger.info(f"[{datetime.now()}] Visual properties updated for tile {tile_id} and saved for mod {mod_name}")
+        logger.info("Visual properties updated for tile %s and saved for mod %s", tile_id, mod_name)
         
         return {
             "message": "Visual properties updated successfully",
@@ -387,14 +441,22 @@ async def update_visual_properties(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error updating visual properties for tile {tile_id}: {str(e)}")
+        logger.error("Error updating visual properties for tile %s: %s", tile_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
+# Largest grid width and height a request may ask for
+_MAX_GRID_SIZE = 50
+
+# Largest grid width and height whose encoded grid is cached. The frontend asks
+# for at most 19x19 (zoom level 10), an entry of roughly 0.25 MB, so the cache
+# stays around 30 MB; larger grids are laid out on every request
+_MAX_CACHED_GRID_SIZE = 19
+
 @router.get("/{tile_id}/grid")
-async def get_tile_grid(
+def get_tile_grid(
     tile_id: str = Path(..., description="H3 index of the tile"),
-    width: int = 5,
-    height: int = 5,
+    width: int = Query(5, ge=1, le=_MAX_GRID_SIZE, description="Number of columns in the grid"),
+    height: int = Query(5, ge=1, le=_MAX_GRID_SIZE, description="Number of rows in the grid"),
     mod_name: str = Query("default", description="Name of the mod/application")
 ):
     """
@@ -408,454 +470,445 @@ async def get_tile_grid(
     Returns:
         A dictionary grid of H3 indexes with the center tile at (0,0)
     """
-    logger.info(f"GET request received for grid centered on tile: {tile_id}, width: {width}, height: {height}, mod: {mod_name}")
+    logger.info("GET request received for grid centered on tile: %s, width: %s, height: %s, mod: %s", tile_id, width, height, mod_name)
     try:
         # Validate the H3 index
-        if not h3.h3_is_valid(tile_id):
-            logger.warning(f"Invalid H3 index: {tile_id}")
+        if not _h3_is_valid(tile_id):
+            logger.warning("Invalid H3 index: %s", tile_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
-        # Add debug info about the tile
-        resolution = h3.h3_get_resolution(tile_id)
-        logger.info(f"DEBUG: Tile {tile_id} has resolution {resolution}")
-        
-        # Use a dictionary to store the grid with coordinate tuples as keys
-        # This allows for negative indexes with the center tile at (0,0)
-        grid_dict = {}
-        
-        # Define the standard mapping from neighbor positions to relative grid coordinates
-        relative_coords_for_even_columns = {
-            "bottom_middle": (-1, 0),
-            "bottom_left": (-1, -1),
-            "top_left": (0, -1),
-            "top_middle": (1, 0),
-            "top_right": (0, 1),
-            "bottom_right": (-1, 1)
-        }
+        # Lay out and encode the grid (cached per center tile and size, for the sizes the frontend uses)
+        encode_grid = _encode_grid if max(width, height) <= _MAX_CACHED_GRID_SIZE else _encode_grid.__wrapped__
+        encoded_grid, grid_tile_ids, created_tile_ids = encode_grid(tile_id, width, height)
+        
+        # The cached layout doesn't touch storage, so make sure its tiles exist
+        _ensure_grid_tiles(tile_id, created_tile_ids)
+        
+        # Stream the response, adding the tile data for each tile as it loads
+        return StreamingResponse(
+            _stream_grid_response(encoded_grid, grid_tile_ids, mod_name),
+            media_type="application/json"
+        )
+    
+    except Exception as e:
+        logger.error("Error creating grid for tile %s: %s", tile_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
 
-        relative_coords_for_odd_columns = {
-            "bottom_middle": (-1, 0),
-            "bottom_left": (0, -1),
-            "top_left": (1, -1),
-            "top_middle": (1, 0),
-            "top_right": (1, 1),
-            "bottom_right": (0, 1)
-        }
+def _json_bytes(obj: Any) -> bytes:
+    """Encode an object as compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
 
-        # Define the inverse mapping for verification
-        inverse_positions = {
-            "bottom_middle": "top_middle",
-            "bottom_left": "top_right",
-            "top_left": "bottom_right",
-            "top_middle": "bottom_middle",
-            "top_right": "bottom_left",
-            "bottom_right": "top_left"
-        }
+def _load_grid_tile_entry(h3_index: str, mod_name: str) -> Optional[bytes]:
+    """
+    Load a grid tile and encode it as a `"<h3 index>":{...}` JSON member.
+    
+    Runs in a worker thread, so the tile read, the hex map lookup and the
+    encoding all happen off the event loop.
+    
+    Args:
+        h3_index: The H3 index of the tile
+        mod_name: The name of the mod/application
         
-        # Step 2: Place center tile at (0,0)
-        center_coords = (0, 0)
-        grid_dict[center_coords] = tile_id
+    Returns:
+        The encoded member, or None if the tile is not in storage
+    """
+    grid_tile = Tile.load(h3_index, mod_name)
+    if grid_tile is None:
+        return None
+    
+    # Get the tile data
+    grid_tile_data = grid_tile.to_dict()
+    
+    # Get the latest map path
+    latest_map_path = get_latest_hex_map_path(h3_index)
+    if latest_map_path:
+        # Convert to relative path for frontend use
+        relative_path = os.path.relpath(latest_map_path, _PROJECT_ROOT)
+        grid_tile_data["latest_map"] = relative_path
+    
+    return _json_bytes(h3_index) + b":" + _json_bytes(grid_tile_data)
 
-        # Load or create the center tile
-        center_tile = Tile.load(tile_id, mod_name)
-        if center_tile is None:
-            logger.info(f"DEBUG: Center tile {tile_id} not found in storage, creating new one")
-            if h3.h3_is_pentagon(tile_id):
-                center_tile = PentagonTile(tile_id)
-            else:
-                center_tile = HexagonTile(tile_id)
-            center_tile.save_static()
-        else:
-            logger.info(f"DEBUG: Center tile {tile_id} loaded from storage")
-        
-        # Debug: Check if the center tile has neighbors
-        logger.info(f"DEBUG: Center tile neighbor_ids: {center_tile.neighbor_ids}")
-        
-        # Debug: Check if H3 library can find neighbors directly
-        direct_neighbors = h3.k_ring(tile_id, 1)
-        direct_neighbors = [n for n in direct_neighbors if n != tile_id]
-        logger.info(f"DEBUG: Direct H3 neighbors: {direct_neighbors}")
-        logger.info(f"DEBUG: Number of direct neighbors: {len(direct_neighbors)}")
-        
-        # Fix for resolution 15 tiles: If neighbor_ids is empty but H3 can find neighbors,
-        # update the neighbor_ids and save the tile
-        if not center_tile.neighbor_ids and direct_neighbors:
-            logger.info(f"DEBUG: Fixing empty neighbor_ids for resolution {resolution} tile")
-            # Use the _get_positioned_neighbors method to get proper position labels
-            center_tile.neighbor_ids = center_tile._get_positioned_neighbors(tile_id)
-            logger.info(f"DEBUG: Updated neighbor_ids: {center_tile.neighbor_ids}")
-            # Save the updated static data
-            center_tile.save_static()
-            logger.info(f"DEBUG: Saved updated static data with neighbor_ids")
-        
-        # Check if we need to use the geographic coordinate-based algorithm
-        # We'll use it if the center tile is a pentagon or if we detect pentagons in the k-ring
-        use_geographic_algorithm = h3.h3_is_pentagon(tile_id)
-        
-        if not use_geographic_algorithm:
-            # Check if there are any pentagons in the k-ring
-            k_ring_size = max(width, height) // 2 + 1
-            k_ring = h3.k_ring(tile_id, k_ring_size)
-            for h3_index in k_ring:
-                if h3.h3_is_pentagon(h3_index):
-                    use_geographic_algorithm = True
-                    logger.info(f"DEBUG: Pentagon detected in k-ring: {h3_index}")
-                    break
+async def _stream_grid_response(encoded_grid: bytes, h3_indexes: Tuple[str, ...], mod_name: str) -> AsyncIterator[bytes]:
+    """
+    Stream a grid response as JSON chunks, appending the "tile_data" object.
+    
+    The encoded grid is sent first. All tiles are then loaded concurrently on
+    the default thread pool and sent in grid order as soon as each is ready.
+    
+    Args:
+        encoded_grid: The encoded grid response, left open for "tile_data"
+        h3_indexes: Unique H3 indexes of the tiles in the grid
+        mod_name: The name of the mod/application
         
-        logger.info(f"DEBUG: Using geographic algorithm: {use_geographic_algorithm}")
+    Yields:
+        Consecutive chunks of the JSON document
+    """
+    yield encoded_grid
+    
+    # Submit every load up front, then await them in order
+    loop = asyncio.get_running_loop()
+    pending = [
+        loop.run_in_executor(None, _load_grid_tile_entry, h3_index, mod_name)
+        for h3_index in h3_indexes
+    ]
+    
+    separator = b""
+    for future in pending:
+        entry = await future
+        if entry is not None:
+            yield separator + entry
+            separator = b","
+    
+    yield b"}}"
+
+def _ensure_grid_tiles(tile_id: str, tile_ids: Tuple[str, ...]) -> None:
+    """
+    Create the static data of the grid tiles that are missing from storage.
+    
+    The center tile is loaded, so that stored static data without neighbor
+    IDs can be repaired; the other tiles are only checked for existence.
+    
+    Args:
+        tile_id: H3 index of the center tile
+        tile_ids: H3 indexes of the other tiles the grid creates
+    """
+    # Load or create the center tile
+    center_tile = Tile.load(tile_id)
+    if center_tile is None:
+        logger.debug("Center tile %s not found in storage, creating new one", tile_id)
+        center_tile = make_tile(tile_id)
+        center_tile.save_static()
+    else:
+        logger.debug("Center tile %s loaded from storage", tile_id)
+
+    # Fix for resolution 15 tiles: If neighbor_ids is empty but H3 can find neighbors,
+    # update the neighbor_ids and save the tile. Every valid cell has direct
+    # neighbors, so H3 is only asked when the stored ones are missing
+    if not center_tile.neighbor_ids and len(h3.k_ring(tile_id, 1)) > 1:
+        logger.debug("Fixing empty neighbor_ids for tile %s", tile_id)
+        # Use the _get_positioned_neighbors method to get proper position labels
+        center_tile.neighbor_ids = center_tile._get_positioned_neighbors(tile_id)
+        logger.debug("Updated neighbor_ids: %s", center_tile.neighbor_ids)
+        # Save the updated static data
+        center_tile.save_static()
+        logger.debug("Saved updated static data with neighbor_ids")
+
+    # Create the missing tiles (static data only) in one batch
+    existing_ids = Tile.existing_ids(tile_ids)
+    missing_ids = [h3_index for h3_index in tile_ids if h3_index not in existing_ids]
+    if missing_ids:
+        logger.debug("Creating %s missing grid tiles", len(missing_ids))
+        Tile.save_static_many([make_tile(h3_index) for h3_index in missing_ids])
+
+@functools.lru_cache(maxsize=128)
+def _encode_grid(tile_id: str, width: int, height: int) -> Tuple[bytes, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Lay out the grid around a center tile and encode it for the grid response.
+    
+    The layout is computed from the H3 topology alone, without reading or
+    writing tile files, so the encoded result is cached per (tile_id, width,
+    height) and shared across mods; requests only encode their own tile data.
+    
+    Args:
+        tile_id: H3 index of the center tile
+        width: Number of columns in the grid
+        height: Number of rows in the grid
         
-        if use_geographic_algorithm:
-            # Geographic coordinate-based algorithm for grids with pentagons
-            logger.info(f"Pentagon detected in grid. Using geographic coordinate-based algorithm.")
-            
-            # Get the k-ring of tiles around the center
-            k_ring_size = max(width, height) // 2 + 1
+    Returns:
+        The encoded response object without its closing brace, ready for the
+        "tile_data" member to be appended, the unique H3 indexes in the grid,
+        and the H3 indexes of the tiles the grid creates besides the center
+    """
+    serializable_grid, pentagon_positions, bounds, created_tile_ids = _build_grid(tile_id, width, height)
+    
+    response = {
+        "center_tile_id": tile_id,
+        "grid": serializable_grid,
+        "pentagon_positions": pentagon_positions,
+        "bounds": bounds
+    }
+    
+    # Reopen the encoded object to append the tile data to it
+    encoded_grid = _json_bytes(response)[:-1] + b',"tile_data":{'
+    return encoded_grid, tuple(dict.fromkeys(serializable_grid.values())), created_tile_ids
+
+def _build_grid(tile_id: str, width: int, height: int) -> Tuple[Dict[str, str], List[List[int]], Dict[str, int], Tuple[str, ...]]:
+    """
+    Lay out the grid of H3 indexes around a center tile.
+    
+    Neighbors are taken from the H3 topology, so the layout doesn't depend
+    on the stored tile files.
+    
+    Args:
+        tile_id: H3 index of the center tile
+        width: Number of columns in the grid
+        height: Number of rows in the grid
+        
+    Returns:
+        A tuple of the serializable grid ("row,col" -> H3 index), the pentagon
+        positions, the grid bounds, and the H3 indexes of the expanded tiles,
+        which must exist in storage
+    """
+    # Add debug info about the tile
+    _, center_is_pentagon, resolution = _classify(tile_id)
+    logger.debug("Tile %s has resolution %s", tile_id, resolution)
+
+    # Use a dictionary to store the grid with coordinate tuples as keys
+    # This allows for negative indexes with the center tile at (0,0)
+    grid_dict = {}
+
+    # Step 2: Place center tile at (0,0)
+    center_coords = (0, 0)
+    grid_dict[center_coords] = tile_id
+
+    # Tiles besides the center that are expanded, and therefore created
+    expanded_ids = []
+
+    # Check if we need to use the geographic coordinate-based algorithm
+    # We'll use it if the center tile is a pentagon or if we detect pentagons in the k-ring
+    pentagon_ids = PENTAGON_IDS[resolution]
+    use_geographic_algorithm = center_is_pentagon
+
+    # The k-ring of tiles around the center, used for both the pentagon check
+    # and the geographic algorithm; only built when needed
+    k_ring_size = max(width, height) // 2 + 1
+    k_ring = None
+
+    if not use_geographic_algorithm and _pentagon_may_be_near(tile_id, resolution, k_ring_size):
+        # Check if there are any pentagons in the k-ring
+        k_ring = h3.k_ring(tile_id, k_ring_size)
+        k_ring_pentagons = pentagon_ids.intersection(k_ring)
+        if k_ring_pentagons:
+            use_geographic_algorithm = True
+            logger.debug("Pentagon detected in k-ring: %s", ", ".join(sorted(k_ring_pentagons)))
+
+    logger.debug("Using geographic algorithm: %s", use_geographic_algorithm)
+
+    if use_geographic_algorithm:
+        # Geographic coordinate-based algorithm for grids with pentagons
+        logger.info("Pentagon detected in grid. Using geographic coordinate-based algorithm.")
+
+        if k_ring is None:
             k_ring = h3.k_ring(tile_id, k_ring_size)
-            
-            # Get geographic coordinates for all tiles in the k-ring
-            tile_coords = {}
-            for h3_index in k_ring:
-                lat, lng = h3.h3_to_geo(h3_index)
-                tile_coords[h3_index] = (lat, lng)
-            
-            # Get center tile coordinates
-            center_lat, center_lng = tile_coords[tile_id]
-            
-            # Group tiles by latitude (rows)
-            # First, sort all tiles by latitude
-            sorted_by_lat = sorted(tile_coords.items(), key=lambda x: x[1][0], reverse=False)  # reverse=False for south-to-north
-            
-            # Calculate the ideal number of rows based on square root of total tiles
-            total_tiles = len(sorted_by_lat)
-            ideal_rows = max(int(math.sqrt(total_tiles)), 1)
-            
-            # Ensure we don't exceed the requested height
-            num_rows = min(ideal_rows, height * 2)
-            
-            logger.info(f"Geographic algorithm: Total tiles: {total_tiles}, Ideal rows: {ideal_rows}, Using rows: {num_rows}")
-            
-            # Calculate the latitude range
-            min_lat = min(lat for _, (lat, _) in sorted_by_lat)
-            max_lat = max(lat for _, (lat, _) in sorted_by_lat)
-            lat_range = max_lat - min_lat
-            
-            logger.info(f"Latitude range: {min_lat} to {max_lat} (range: {lat_range})")
-            
-            # Create latitude buckets with approximately equal number of tiles per bucket
-            lat_buckets = []
-            if lat_range > 0 and num_rows > 1:
-                # Distribute tiles evenly across buckets
-                tiles_per_bucket = total_tiles // num_rows
-                if tiles_per_bucket < 1:
-                    tiles_per_bucket = 1
-                
-                for i in range(num_rows):
-                    start_idx = i * tiles_per_bucket
-                    end_idx = min((i + 1) * tiles_per_bucket, total_tiles)
-                    
-                    # If this is the last bucket, include all remaining tiles
-                    if i == num_rows - 1:
-                        end_idx = total_tiles
-                    
-                    # Skip empty buckets
-                    if start_idx >= end_idx:
-                        continue
-                    
-                    # Get min and max latitude for this bucket
-                    bucket_tiles = sorted_by_lat[start_idx:end_idx]
-                    bucket_min_lat = min(lat for _, (lat, _) in bucket_tiles)
-                    bucket_max_lat = max(lat for _, (lat, _) in bucket_tiles)
-                    
-                    # Add a small buffer to avoid edge cases
-                    buffer = (lat_range * 0.01)
-                    if i > 0:  # Not the first bucket
-                        bucket_min_lat -= buffer
-                    if i < num_rows - 1:  # Not the last bucket
-                        bucket_max_lat += buffer
-                    
-                    lat_buckets.append((bucket_min_lat, bucket_max_lat))
-                    logger.info(f"Bucket {i}: {bucket_min_lat} to {bucket_max_lat} with {len(bucket_tiles)} tiles")
-            else:
-                # If all tiles have the same latitude or only one row, create a single bucket
-                lat_buckets.append((min_lat, max_lat))
-            
-            # Assign tiles to buckets
-            rows = [[] for _ in range(len(lat_buckets))]
-            for h3_index, (lat, lng) in tile_coords.items():
-                assigned = False
-                for i, (bucket_min, bucket_max) in enumerate(lat_buckets):
-                    if bucket_min <= lat <= bucket_max or (i == 0 and lat < bucket_min) or (i == len(lat_buckets) - 1 and lat > bucket_max):
-                        rows[i].append((h3_index, lng))
-                        assigned = True
-                        break
-                if not assigned:
-                    logger.warning(f"Tile {h3_index} with lat {lat} not assigned to any bucket!")
-            
-            # Log the number of tiles in each row
+
+        # Get geographic coordinates for all tiles in the k-ring
+        tile_coords = {h3_index: h3.h3_to_geo(h3_index) for h3_index in k_ring}
+
+        # Get center tile coordinates
+        center_lat, center_lng = tile_coords[tile_id]
+
+        # Group tiles by latitude (rows)
+        # First, sort all tiles by latitude
+        sorted_by_lat = sorted(tile_coords.items(), key=lambda x: x[1][0], reverse=False)  # reverse=False for south-to-north
+
+        # Calculate the ideal number of rows based on square root of total tiles
+        total_tiles = len(sorted_by_lat)
+        ideal_rows = max(int(math.sqrt(total_tiles)), 1)
+
+        # Ensure we don't exceed the requested height
+        num_rows = min(ideal_rows, height * 2)
+
+        logger.info("Geographic algorithm: Total tiles: %s, Ideal rows: %s, Using rows: %s", total_tiles, ideal_rows, num_rows)
+
+        # Calculate the latitude range (the tiles are sorted by latitude)
+        min_lat = sorted_by_lat[0][1][0]
+        max_lat = sorted_by_lat[-1][1][0]
+        lat_range = max_lat - min_lat
+
+        logger.info("Latitude range: %s to %s (range: %s)", min_lat, max_lat, lat_range)
+
+        # Create latitude buckets with approximately equal number of tiles per bucket
+        lat_buckets = []
+        if lat_range > 0 and num_rows > 1:
+            # Distribute tiles evenly across buckets
+            tiles_per_bucket = total_tiles // num_rows
+            if tiles_per_bucket < 1:
+                tiles_per_bucket = 1
+
+            for i in range(num_rows):
+                start_idx = i * tiles_per_bucket
+                end_idx = min((i + 1) * tiles_per_bucket, total_tiles)
+
+                # If this is the last bucket, include all remaining tiles
+                if i == num_rows - 1:
+                    end_idx = total_tiles
+
+                # Skip empty buckets
+                if start_idx >= end_idx:
+                    continue
+
+                # Get min and max latitude for this bucket from its sorted slice
+                bucket_min_lat = sorted_by_lat[start_idx][1][0]
+                bucket_max_lat = sorted_by_lat[end_idx - 1][1][0]
+
+                # Add a small buffer to avoid edge cases
+                buffer = (lat_range * 0.01)
+                if i > 0:  # Not the first bucket
+                    bucket_min_lat -= buffer
+                if i < num_rows - 1:  # Not the last bucket
+                    bucket_max_lat += buffer
+
+                lat_buckets.append((bucket_min_lat, bucket_max_lat))
+                logger.debug("Bucket %s: %s to %s with %s tiles", i, bucket_min_lat, bucket_max_lat, end_idx - start_idx)
+        else:
+            # If all tiles have the same latitude or only one row, create a single bucket
+            lat_buckets.append((min_lat, max_lat))
+
+        # Assign tiles to buckets. The buckets are built from consecutive slices
+        # of the sorted tiles, so their upper bounds never decrease and the first
+        # bucket whose upper bound reaches a tile's latitude is the first one
+        # that contains it; tiles beyond the last bound go to the last bucket
+        rows = [[] for _ in range(len(lat_buckets))]
+        bucket_maxes = [bucket_max for _, bucket_max in lat_buckets]
+        last_bucket = len(lat_buckets) - 1
+        for h3_index, (lat, lng) in tile_coords.items():
+            rows[min(bisect.bisect_left(bucket_maxes, lat), last_bucket)].append((h3_index, lng))
+
+        # Log the number of tiles in each row
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
             for i, row in enumerate(rows):
-                logger.info(f"Row {i} has {len(row)} tiles")
-            
-            # Sort tiles within each row by longitude (west to east)
-            for i in range(len(rows)):
-                rows[i].sort(key=lambda x: x[1])
-            
-            # Log the sorted rows
+                logger.debug("Row %s has %s tiles", i, len(row))
+
+        # Sort tiles within each row by longitude (west to east)
+        for i in range(len(rows)):
+            rows[i].sort(key=lambda x: x[1])
+
+        # Log the sorted rows
+        if debug:
             for i, row in enumerate(rows):
                 if row:
-                    logger.info(f"Row {i} after sorting: {[h3_idx for h3_idx, _ in row]}")
-            
-            # Calculate grid coordinates
-            center_row_idx = None
-            center_col_idx = None
-            
-            # Find the row and column of the center tile
-            for row_idx, row in enumerate(rows):
-                for col_idx, (h3_index, _) in enumerate(row):
-                    if h3_index == tile_id:
-                        center_row_idx = row_idx
-                        center_col_idx = col_idx
-                        logger.info(f"Found center tile at row {row_idx}, col {col_idx}")
-                        break
-                if center_row_idx is not None:
-                    break
-            
-            # If center tile wasn't found in any row, default to middle position
-            if center_row_idx is None:
-                center_row_idx = len(rows) // 2
-                center_col_idx = 0
-                logger.warning(f"Center tile not found in any row. Using default position: row {center_row_idx}, col {center_col_idx}")
-                
-            # Verify that the center tile will be at (0,0)
-            test_grid_row = center_row_idx - center_row_idx
-            test_grid_col = center_col_idx - center_col_idx
-            if test_grid_row != 0 or test_grid_col != 0:
-                logger.error(f"Center tile calculation error! Would be at ({test_grid_row}, {test_grid_col}) instead of (0,0)")
-                
-            # Assign grid coordinates to each tile
-            for row_idx, row in enumerate(rows):
-                for col_idx, (h3_index, _) in enumerate(row):
-                    grid_row = row_idx - center_row_idx
-                    grid_col = col_idx - center_col_idx
-                    grid_dict[(grid_row, grid_col)] = h3_index
-                    logger.info(f"Assigned tile {h3_index} to grid position ({grid_row}, {grid_col})")
-            
-            # Double-check that the center tile is at (0,0)
-            if tile_id != grid_dict.get((0, 0)):
-                logger.error(f"Center tile {tile_id} not at (0,0)! Found {grid_dict.get((0, 0))} instead.")
-                # Force the center tile to be at (0,0)
-                grid_dict[(0, 0)] = tile_id
-        else:
-            # Original algorithm for regular hexagonal grids
-            # Track which tiles have been placed and their positions
-            position_map = {tile_id: center_coords}
-            
-            # Step 3: Place immediate neighbors of the center tile
-            # This establishes the center tile as the single source of truth
-            logger.info(f"DEBUG: Placing immediate neighbors of center tile")
-            for position, neighbor_id in center_tile.neighbor_ids.items():
-                logger.info(f"DEBUG: Processing neighbor at position {position}: {neighbor_id}")
-                if neighbor_id == "pentagon":
-                    logger.info(f"DEBUG: Skipping pentagon placeholder at position {position}")
-                    continue
-                    
-                if position in relative_coords_for_even_columns:
-                    row_offset, col_offset = relative_coords_for_even_columns[position]
-                    neighbor_coords = (center_coords[0] + row_offset, center_coords[1] + col_offset)
-                    logger.info(f"DEBUG: Placing neighbor {neighbor_id} at coordinates {neighbor_coords}")
-                    
-                    # Place the neighbor in the grid
-                    grid_dict[neighbor_coords] = neighbor_id
-                    position_map[neighbor_id] = neighbor_coords
-                else:
-                    logger.warning(f"DEBUG: Position {position} not found in relative_coords_for_even_columns")
-
-            # Step 4: Initialize processing
-            done_tiles = {(0, 0)}  # Set of processed tile coordinates
-            logger.info(f"DEBUG: Initial done_tiles: {done_tiles}")
-
-            n_rings = int(max([width, height]) + 1)
-            logger.info(f"DEBUG: Processing {n_rings} rings")
-
-            # Step 5: Process neighbors
-            for i in range(n_rings):
-                logger.info(f"DEBUG: Processing ring {i+1} of {n_rings}")
-                # Go over all placed tiles but skip the ones that are done
-                for coords, current_id in list(grid_dict.items()):
-                    logger.info(f"DEBUG: Processing tile {current_id} at coordinates {coords}")
-
-                    if coords in done_tiles:
-                        # Skip already processed tiles
-                        logger.info(f"DEBUG: Skipping already processed tile {current_id} at {coords}")
-                        continue
-
-                    # Load the current tile
-                    current_tile = Tile.load(current_id, mod_name)
-
-                    if current_tile is None:
-                        logger.info(f"[{datetime.now()}] Tile {current_id} not found in storage, creating new one")
-                        if h3.h3_is_pentagon(current_id):
-                            current_tile = PentagonTile(current_id)
-                        else:
-                            current_tile = HexagonTile(current_id)
-
-                        # Save the static data for the newly created tile
-                        current_tile.save_static()
-                        logger.info(f"[{datetime.now()}] New tile {current_id} static data saved to storage")
-                    
-                    # Debug: Check if the current tile has neighbors
-                    logger.info(f"DEBUG: Current tile {current_id} neighbor_ids: {current_tile.neighbor_ids}")
-
-                    # Process each neighbor
-                    error=False
-                    for position, neighbor_id in current_tile.neighbor_ids.items():
-                        logger.info(f"DEBUG: Processing neighbor at position {position}: {neighbor_id}")
-                        # Skip pentagon placeholders
-                        if neighbor_id == "pentagon":
-                            logger.info(f"DEBUG: Skipping pentagon placeholder at position {position}")
-                            continue
-
-                        # Find the relative coordinates
-                        if coords[1] % 2 == 0:  # Even column
-                            relative_coords = (coords[0]+relative_coords_for_even_columns[position][0],
-                                            coords[1]+relative_coords_for_even_columns[position][1])
-                            logger.info(f"DEBUG: Using even column offset for position {position}: {relative_coords_for_even_columns[position]}")
-                        else:  # Odd column
-                            relative_coords = (coords[0] + relative_coords_for_odd_columns[position][0],
-                                            coords[1] + relative_coords_for_odd_columns[position][1])
-                            logger.info(f"DEBUG: Using odd column offset for position {position}: {relative_coords_for_odd_columns[position]}")
-                        
-                        logger.info(f"DEBUG: Calculated relative coordinates for neighbor {neighbor_id}: {relative_coords}")
-
-                        # Place the neighbor in the grid
-                        if relative_coords in grid_dict and grid_dict[relative_coords] != neighbor_id:
-                            logger.error(f'ERROR: trying to overwrite existing tile {relative_coords} with new data {neighbor_id}')
-                            error=True
-                            break
-
-                        grid_dict[relative_coords] = neighbor_id
-                        logger.info(f"DEBUG: Added neighbor {neighbor_id} to grid at position {relative_coords}")
-
-                    if error:
-                        logger.error(f"DEBUG: Error detected, breaking out of neighbor processing loop")
-                        break
-
-                    # Mark the current tile as done
-                    done_tiles.add(coords)
-                    logger.info(f"DEBUG: Marked tile {current_id} at {coords} as done")
-        
-        # Identify pentagon positions
-        pentagon_positions = []
-        for coords, grid_tile_id in grid_dict.items():
-            if grid_tile_id is not None and h3.h3_is_pentagon(grid_tile_id):
-                pentagon_positions.append(list(coords))
-        
-        logger.info(f"Grid created successfully with center tile and immediate neighbors only")
-        logger.info(f"Found {len(pentagon_positions)} pentagons in the grid")
-        
-        # Count filled cells for logging
-        filled_count = len(grid_dict)
-        logger.info(f"Grid stats: {filled_count} filled cells")
-        
-        # Convert dictionary keys from tuples to strings for JSON serialization
-        serializable_grid = {}
-        for coords, grid_tile_id in grid_dict.items():
-            # Convert tuple key to string key "row,col"
-            key = f"{coords[0]},{coords[1]}"
-            serializable_grid[key] = grid_tile_id
-        
-        # Calculate the bounds of the grid
-        min_row = min(coords[0] for coords in grid_dict.keys())
-        max_row = max(coords[0] for coords in grid_dict.keys())
-        min_col = min(coords[1] for coords in grid_dict.keys())
-        max_col = max(coords[1] for coords in grid_dict.keys())
-        
-        response = {
-            "center_tile_id": tile_id,
-            "grid": serializable_grid,
-            "pentagon_positions": pentagon_positions,
-            "bounds": {
-                "min_row": min_row,
-                "max_row": max_row,
-                "min_col": min_col,
-                "max_col": max_col
-            }
+                    logger.debug("Row %s after sorting: %s", i, [h3_idx for h3_idx, _ in row])
+
+        # Record the row and column of every tile
+        positions = {
+            h3_index: (row_idx, col_idx)
+            for row_idx, row in enumerate(rows)
+            for col_idx, (h3_index, _) in enumerate(row)
         }
-        
-        # Add tile data for all tiles in the grid
-        tile_data = {}
-        for h3_index in set(serializable_grid.values()):
-            if h3_index is not None:
-                # Load the tile data
-                grid_tile = Tile.load(h3_index, mod_name)
-                if grid_tile:
-                    # Get the tile data
-                    grid_tile_data = grid_tile.to_dict()
-                    
-                    # Get the latest map path
-                    latest_map_path = get_latest_hex_map_path(h3_index)
-                    if latest_map_path:
-                        # Convert to relative path for frontend use
-                        relative_path = os.path.relpath(latest_map_path, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-                        grid_tile_data["latest_map"] = relative_path
-                    
-                    # Add to the tile data dictionary
-                    tile_data[h3_index] = grid_tile_data
-        
-        # Add the tile data to the response
-        response["tile_data"] = tile_data
-        
-        return response
+
+        # Find the row and column of the center tile
+        if tile_id in positions:
+            center_row_idx, center_col_idx = positions[tile_id]
+            logger.info("Found center tile at row %s, col %s", center_row_idx, center_col_idx)
+        else:
+            # If center tile wasn't found in any row, default to middle position
+            center_row_idx = len(rows) // 2
+            center_col_idx = 0
+            logger.warning("Center tile not found in any row. Using default position: row %s, col %s", center_row_idx, center_col_idx)
+
+        # Assign grid coordinates to each tile, relative to the center tile
+        for h3_index, (row_idx, col_idx) in positions.items():
+            grid_row = row_idx - center_row_idx
+            grid_col = col_idx - center_col_idx
+            grid_dict[(grid_row, grid_col)] = h3_index
+            if debug:
+                logger.debug("Assigned tile %s to grid position (%s, %s)", h3_index, grid_row, grid_col)
+
+        # Double-check that the center tile is at (0,0)
+        if tile_id != grid_dict.get((0, 0)):
+            logger.error("Center tile %s not at (0,0)! Found %s instead.", tile_id, grid_dict.get((0, 0)))
+            # Force the center tile to be at (0,0)
+            grid_dict[(0, 0)] = tile_id
+    else:
+        # Original algorithm for regular hexagonal grids
+        # Step 3: Place immediate neighbors of the center tile
+        # This establishes the center tile as the single source of truth
+        logger.debug("Placing immediate neighbors of center tile")
+        for position_idx, neighbor_id in enumerate(Tile._get_positioned_neighbors(tile_id)):
+            logger.debug("Processing neighbor at position %s: %s", Tile.NEIGHBOR_POSITIONS[position_idx], neighbor_id)
+            if neighbor_id == "pentagon":
+                logger.debug("Skipping pentagon placeholder at position %s", Tile.NEIGHBOR_POSITIONS[position_idx])
+                continue
+
+            row_offset, col_offset = _DELTA[0][position_idx]
+            neighbor_coords = (center_coords[0] + row_offset, center_coords[1] + col_offset)
+            logger.debug("Placing neighbor %s at coordinates %s", neighbor_id, neighbor_coords)
+
+            # Place the neighbor in the grid
+            grid_dict[neighbor_coords] = neighbor_id
+
+        # Step 4: Expand breadth-first from the immediate neighbors
+        n_rings = int(max([width, height]) + 1)
+        logger.debug("Processing %s rings", n_rings)
+        expanded_ids = _expand_hex_grid(grid_dict, n_rings)
+
+    # Serialize the grid, collect pentagon positions and calculate the bounds
+    # in a single pass; keys become "row,col" strings for JSON serialization
+    serializable_grid = {}
+    pentagon_positions = []
+    min_row, min_col = max_row, max_col = next(iter(grid_dict))
+    for (row, col), grid_tile_id in grid_dict.items():
+        serializable_grid[f"{row},{col}"] = grid_tile_id
+        if grid_tile_id in pentagon_ids:
+            pentagon_positions.append([row, col])
+        if row < min_row:
+            min_row = row
+        elif row > max_row:
+            max_row = row
+        if col < min_col:
+            min_col = col
+        elif col > max_col:
+            max_col = col
+
+    logger.info("Grid created successfully with center tile and immediate neighbors only")
+    logger.info("Found %s pentagons in the grid", len(pentagon_positions))
+    logger.info("Grid stats: %s filled cells", len(grid_dict))
+
+    bounds = {
+        "min_row": min_row,
+        "max_row": max_row,
+        "min_col": min_col,
+        "max_col": max_col
+    }
     
-    except Exception as e:
-        logger.error(f"Error creating grid for tile {tile_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return serializable_grid, pentagon_positions, bounds, tuple(expanded_ids)
 
 @router.get("/{tile_id}/resolutions")
-async def get_resolutions(
+def get_resolutions(
     tile_id: str = Path(..., description="H3 index of the tile"),
     mod_name: str = Query("default", description="Name of the mod/application")
 ):
     """Get all resolution IDs for a specific tile."""
-    logger.info(f"[{datetime.now()}] GET request received for resolutions of tile: {tile_id}, mod: {mod_name}")
+    logger.info("GET request received for resolutions of tile: %s, mod: %s", tile_id, mod_name)
     try:
         # Validate the H3 index
-        if not h3.h3_is_valid(tile_id):
-            logger.warning(f"[{datetime.now()}] Invalid H3 index: {tile_id}")
+        if not _h3_is_valid(tile_id):
+            logger.warning("Invalid H3 index: %s", tile_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
         # Load or create the tile
         tile = Tile.load(tile_id, mod_name)
         if tile is None:
-            logger.info(f"[{datetime.now()}] Tile {tile_id} not found in storage, creating new one")
-            if h3.h3_is_pentagon(tile_id):
-                tile = PentagonTile(tile_id)
-            else:
-                tile = HexagonTile(tile_id)
+            logger.info("Tile %s not found in storage, creating new one", tile_id)
+            tile = make_tile(tile_id)
             
             # Save the static data for the newly created tile
             tile.save_static()
-            logger.info(f"[{datetime.now()}] New tile {tile_id} static data saved to storage")
+            logger.info("New tile %s static data saved to storage", tile_id)
         
         # Return resolution IDs
-        logger.info(f"[{datetime.now()}] Returning {len(tile.resolution_ids)} resolution IDs for tile {tile_id}")
+        logger.info("Returning %s resolution IDs for tile %s", len(tile.resolution_ids), tile_id)
         return {
             "tile_id": tile_id,
-            "resolution_ids": tile.resolution_ids
+            "resolution_ids": tile.resolution_ids_dict()
         }
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error getting resolutions for tile {tile_id}: {str(e)}")
+        logger.error("Error getting resolutions for tile %s: %s", tile_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{tile_id}/generate-map")
-async def generate_map(
+def generate_map(
     tile_id: str = Path(..., description="H3 index of the tile to generate map for")
 ):
     """Generate a map image for a specific tile."""
-    logger.info(f"[{datetime.now()}] POST request received to generate map for tile: {tile_id}")
+    logger.info("POST request received to generate map for tile: %s", tile_id)
     try:
         # Validate the H3 index
-        if not h3.h3_is_valid(tile_id):
-            logger.warning(f"[{datetime.now()}] Invalid H3 index: {tile_id}")
+        if not _h3_is_valid(tile_id):
+            logger.warning("Invalid H3 index: %s", tile_id)
             raise HTTPException(status_code=400, detail="Invalid H3 index")
         
         # Try to load the tile
@@ -863,25 +916,88 @@ async def generate_map(
         
         # If not found in storage, create a new one
         if tile is None:
-            logger.info(f"[{datetime.now()}] Tile {tile_id} not found in storage, creating new tile")
-            if h3.h3_is_pentagon(tile_id):
-                tile = PentagonTile(tile_id)
-            else:
-                tile = HexagonTile(tile_id)
+            logger.info("Tile %s not found in storage, creating new tile", tile_id)
+            tile = make_tile(tile_id)
             
             # Save the static data for the newly created tile
             tile.save_static()
         
         # Generate the map
-        logger.info(f"[{datetime.now()}] Generating map for tile: {tile_id}")
+        logger.info("Generating map for tile: %s", tile_id)
         tile.generate_hex_map()
         
         return {"status": "success", "message": f"Map generated for tile {tile_id}"}
     
     except Exception as e:
-        logger.error(f"[{datetime.now()}] Error generating map for tile {tile_id}: {str(e)}")
+        logger.error("Error generating map for tile %s: %s", tile_id, e)
         raise HTTPException(status_code=500, detail=f"Error generating map: {str(e)}")
 
+def _expand_hex_grid(grid_dict: Dict[Tuple[int, int], str], n_rings: int) -> List[str]:
+    """
+    Expand a hexagonal grid breadth-first from the tiles placed around (0,0).
+    
+    The grid grows one ring at a time, expanding the tiles of a ring in
+    placement order. Tiles beyond the last ring are placed but not expanded.
+    Expansion stops at the first collision, since the layout can no longer
+    be trusted.
+    
+    Args:
+        grid_dict: The grid being built, (row, col) -> H3 index; updated in place
+        n_rings: Number of rings to expand
+        
+    Returns:
+        The H3 indexes of the expanded tiles, in expansion order
+    """
+    # Checked once; the per-tile debug logs would otherwise dominate the loop
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    ring_tiles = [(coords, h3_index) for coords, h3_index in grid_dict.items() if coords != (0, 0)]
+    expanded_ids = []
+
+    for _ in range(n_rings):
+        next_ring_tiles = []
+
+        for coords, current_id in ring_tiles:
+            if debug:
+                logger.debug("Processing tile %s at coordinates %s", current_id, coords)
+            expanded_ids.append(current_id)
+
+            # Neighbor IDs ordered by position, cached per H3 index
+            neighbor_ids = Tile._get_positioned_neighbors(current_id)
+            if debug:
+                logger.debug("Current tile %s neighbor_ids: %s", current_id, neighbor_ids)
+
+            # Process each neighbor
+            for position_idx, neighbor_id in enumerate(neighbor_ids):
+                if debug:
+                    logger.debug("Processing neighbor at position %s: %s", Tile.NEIGHBOR_POSITIONS[position_idx], neighbor_id)
+                # Skip pentagon placeholders
+                if neighbor_id == "pentagon":
+                    if debug:
+                        logger.debug("Skipping pentagon placeholder at position %s", Tile.NEIGHBOR_POSITIONS[position_idx])
+                    continue
+
+                # Find the relative coordinates from the column parity
+                drow, dcol = _DELTA[coords[1] & 1][position_idx]
+                relative_coords = (coords[0] + drow, coords[1] + dcol)
+                if debug:
+                    logger.debug("Calculated relative coordinates for neighbor %s: %s", neighbor_id, relative_coords)
+
+                # Place the neighbor in the grid and queue it for the next ring
+                existing_id = grid_dict.get(relative_coords)
+                if existing_id is None:
+                    grid_dict[relative_coords] = neighbor_id
+                    next_ring_tiles.append((relative_coords, neighbor_id))
+                    if debug:
+                        logger.debug("Added neighbor %s to grid at position %s", neighbor_id, relative_coords)
+                elif existing_id != neighbor_id:
+                    logger.error("Grid collision at %s: %s vs %s", relative_coords, existing_id, neighbor_id)
+                    return expanded_ids
+
+        ring_tiles = next_ring_tiles
+
+    return expanded_ids
+
 def _calculate_distance(point1, point2):
     """
     Calculate the squared distance between two points (lat, lng).
@@ -1,18 +1,41 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+import anyio.to_thread
 import logging
-from datetime import datetime
+import os
+import time
 
 from .api import tiles, geocode
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; responses are encoded with the standard library without it
+    orjson = None
+
+# Set up logging once for the whole app; the routers only create loggers.
+# Timestamps come from the formatter, so log calls don't need to add their own
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
 logger = logging.getLogger(__name__)
 
+# Maximum number of sync endpoints running at once in the worker thread pool
+THREADPOOL_SIZE = 100
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure the worker thread pool that runs the blocking endpoints."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
 app = FastAPI(
     title="HexGlobe API",
     description="A web application framework that implements a global hexagonal grid system",
     version="0.1.0",
+    lifespan=lifespan,
+    # Encode responses of all routers with orjson when it is installed
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
 )
 
 # Enable CORS for frontend
@@ -24,21 +47,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add middleware to log all requests
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = datetime.now()
-    path = request.url.path
-    method = request.method
-    
-    logger.info(f"[{start_time}] {method} request received: {path}")
-    
-    response = await call_next(request)
-    
-    process_time = datetime.now() - start_time
-    logger.info(f"[{datetime.now()}] {method} request completed: {path} - Status: {response.status_code} - Time: {process_time.total_seconds():.4f}s")
-    
-    return response
+# Log the status and duration of every request when HEXGLOBE_REQUEST_LOG is set
+if os.environ.get("HEXGLOBE_REQUEST_LOG"):
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        start_time = time.perf_counter()
+        response = await call_next(request)
+        process_time = time.perf_counter() - start_time
+        logger.info("%s request completed: %s - Status: %s - Time: %.4fs",
+                    request.method, request.url.path, response.status_code, process_time)
+        return response
 
 # Include routers
 app.include_router(tiles.router)
@@ -1,18 +1,109 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, replace
+import functools
+import importlib.util
+import itertools
 import json
 import os
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 import h3
 import math
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the standard library json module is used without it
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Base data directory
 BASE_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "data")
 
+# Shared worker pool for batched tile file I/O (file reads and writes release the GIL)
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tile-io")
+
+# The script that renders the hex map images
+_HEX_MAP_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+    "frontend", "assets", "generate_hex_map.py"
+)
+
+# Data directories known to exist, so writes can skip creating them
+_KNOWN_DIRS: Set[str] = set()
+
+# Numbers the temporary files of this process, so concurrent writers never share one
+_TEMP_FILE_COUNTER = itertools.count()
+
+# Keys of the per-resolution IDs of a tile
+_RESOLUTION_KEYS = tuple(str(res) for res in range(16))
+
+# H3 lookups that are repeated for the same tiles. H3 indexes are immutable,
+# so their results can be cached indefinitely.
+@functools.lru_cache(maxsize=65536)
+def _h3_parent(h3_index: str) -> Optional[str]:
+    """Returns the parent of an H3 index, or None at resolution 0."""
+    resolution = h3.h3_get_resolution(h3_index)
+    return h3.h3_to_parent(h3_index, resolution - 1) if resolution > 0 else None
+
+@functools.lru_cache(maxsize=65536)
+def _h3_children(h3_index: str) -> Tuple[str, ...]:
+    """Returns the children of an H3 index one resolution finer."""
+    return tuple(h3.h3_to_children(h3_index, h3.h3_get_resolution(h3_index) + 1))
+
+@functools.lru_cache(maxsize=65536)
+def _h3_is_pentagon(h3_index: str) -> bool:
+    """Returns whether an H3 index is a pentagon."""
+    return h3.h3_is_pentagon(h3_index)
+
+@functools.lru_cache(maxsize=65536)
+def _h3_to_geo(h3_index: str) -> Tuple[float, float]:
+    """Returns the (lat, lng) center of an H3 index."""
+    return h3.h3_to_geo(h3_index)
+
+@functools.lru_cache(maxsize=65536)
+def _h3_boundary(h3_index: str) -> Tuple[Tuple[float, float], ...]:
+    """Returns the (lat, lng) boundary vertices of an H3 index."""
+    return tuple(h3.h3_to_geo_boundary(h3_index))
+
+@functools.lru_cache(maxsize=65536)
+def _h3_resolution_ids(h3_index: str) -> Tuple[str, ...]:
+    """Returns the H3 indexes at the center of an H3 index for all resolutions (0-15)."""
+    current_res = h3.h3_get_resolution(h3_index)
+    
+    # Get geographic coordinates of this location
+    lat, lng = _h3_to_geo(h3_index)
+    logger.debug("Calculating all resolution IDs for location (%s, %s)", lat, lng)
+    
+    # Coarser resolutions use the cell at this location, which is not
+    # always the H3 parent; the finer cells at this location are the
+    # center children, which H3 can derive without a lookup
+    geo_to_h3 = h3.geo_to_h3
+    center_child = h3.h3_to_center_child
+    return (
+        tuple(geo_to_h3(lat, lng, res) for res in range(current_res))
+        + (h3_index,)
+        + tuple(center_child(h3_index, res) for res in range(current_res + 1, 16))  # H3 supports resolutions 0-15
+    )
+
+@functools.lru_cache(maxsize=65536)
+def _path_parts(h3_index: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Split an H3 index into the parts of its data directories.
+    
+    Args:
+        h3_index: The H3 index of the tile
+        
+    Returns:
+        The resolution directory name and the 2-digit directory segments of the index
+    """
+    resolution = h3.h3_get_resolution(h3_index)
+    return f"res_{resolution}", tuple(h3_index[i:i+2] for i in range(0, len(h3_index) - 1, 2))
+
 def get_static_path(h3_index: str) -> str:
     """
     Calculate the path for static tile data based on H3 index.
@@ -23,21 +114,8 @@ def get_static_path(h3_index: str) -> str:
     Returns:
         The absolute file path for the static data JSON file
     """
-    # Get resolution from the index
-    resolution = h3.h3_get_resolution(h3_index)
-    
-    # Create directory structure with 2-digit segments
-    path_segments = []
-    for i in range(0, len(h3_index) - 1, 2):
-        if i + 1 < len(h3_index):
-            segment = h3_index[i:i+2]
-            path_segments.append(segment)
-    
-    # Construct the path
-    static_dir = os.path.join(BASE_DATA_DIR, "static", f"res_{resolution}", *path_segments)
-    os.makedirs(static_dir, exist_ok=True)
-    
-    return os.path.join(static_dir, f"{h3_index}.json")
+    # BASE_DATA_DIR is part of the cache key, so changing it doesn't return stale paths
+    return _static_path(BASE_DATA_DIR, h3_index)
 
 def get_dynamic_path(h3_index: str, mod_name: str = "default") -> str:
     """
@@ -50,9 +128,25 @@ def get_dynamic_path(h3_index: str, mod_name: str = "default") -> str:
     Returns:
         The path to the dynamic data file
     """
-    resolution = h3.h3_get_resolution(h3_index)
-    path_segments = [h3_index[i:i+2] for i in range(0, min(len(h3_index), 10), 2)]
-    dynamic_dir = os.path.join(BASE_DATA_DIR, "dynamic", mod_name, f"res_{resolution}", *path_segments)
+    return _dynamic_path(BASE_DATA_DIR, h3_index, mod_name)
+
+@functools.lru_cache(maxsize=65536)
+def _static_path(base_dir: str, h3_index: str) -> str:
+    """Builds the static data path of an H3 index below a data directory."""
+    # Directory structure with 2-digit segments
+    res_dir, path_segments = _path_parts(h3_index)
+    
+    # Construct the path
+    static_dir = os.path.join(base_dir, "static", res_dir, *path_segments)
+    
+    return os.path.join(static_dir, f"{h3_index}.json")
+
+@functools.lru_cache(maxsize=65536)
+def _dynamic_path(base_dir: str, h3_index: str, mod_name: str) -> str:
+    """Builds the dynamic data path of an H3 index below a data directory."""
+    # Dynamic data only uses the first five 2-digit segments
+    res_dir, path_segments = _path_parts(h3_index)
+    dynamic_dir = os.path.join(base_dir, "dynamic", mod_name, res_dir, *path_segments[:5])
     return os.path.join(dynamic_dir, f"{h3_index}.json")
 
 def get_hex_map_path(h3_index: str, timestamp: str = None, create_dirs: bool = False) -> str:
@@ -67,18 +161,11 @@ def get_hex_map_path(h3_index: str, timestamp: str = None, create_dirs: bool = F
     Returns:
         The absolute file path for the hex map PNG file
     """
-    # Get resolution from the index
-    resolution = h3.h3_get_resolution(h3_index)
-    
-    # Create directory structure with 2-digit segments
-    path_segments = []
-    for i in range(0, len(h3_index) - 1, 2):
-        if i + 1 < len(h3_index):
-            segment = h3_index[i:i+2]
-            path_segments.append(segment)
+    # Directory structure with 2-digit segments
+    res_dir, path_segments = _path_parts(h3_index)
     
     # Construct the path
-    hex_maps_dir = os.path.join(BASE_DATA_DIR, "hex_maps", f"res_{resolution}", *path_segments)
+    hex_maps_dir = os.path.join(BASE_DATA_DIR, "hex_maps", res_dir, *path_segments)
     
     # Only create directories if explicitly requested
     if create_dirs:
@@ -100,147 +187,369 @@ def get_latest_hex_map_path(h3_index: str) -> str:
     Returns:
         The absolute file path for the most recent hex map PNG file
     """
-    # Get resolution from the index
-    resolution = h3.h3_get_resolution(h3_index)
-    
-    # Create directory structure with 2-digit segments
-    path_segments = []
-    for i in range(0, len(h3_index) - 1, 2):
-        if i + 1 < len(h3_index):
-            segment = h3_index[i:i+2]
-            path_segments.append(segment)
+    # Directory structure with 2-digit segments
+    res_dir, path_segments = _path_parts(h3_index)
     
     # Construct the path
-    hex_maps_dir = os.path.join(BASE_DATA_DIR, "hex_maps", f"res_{resolution}", *path_segments)
+    hex_maps_dir = os.path.join(BASE_DATA_DIR, "hex_maps", res_dir, *path_segments)
     
     # Check if directory exists before trying to list files
-    if not os.path.exists(hex_maps_dir):
+    try:
+        dir_mtime = os.stat(hex_maps_dir).st_mtime_ns
+    except FileNotFoundError:
         return None
     
-    # Look for timestamped map files
-    import glob
-    map_files = glob.glob(os.path.join(hex_maps_dir, f"{h3_index}_*.png"))
+    # The directory mtime changes whenever a map is added or removed,
+    # so it invalidates the cached lookup automatically
+    return _find_latest_hex_map_path(h3_index, hex_maps_dir, dir_mtime)
+
+@functools.lru_cache(maxsize=4096)
+def _find_latest_hex_map_path(h3_index: str, hex_maps_dir: str, dir_mtime: int) -> Optional[str]:
+    """
+    Scan a hex map directory for the most recent map image of a tile.
     
-    if map_files:
-        # Sort by timestamp (newest first)
-        map_files.sort(reverse=True)
-        return map_files[0]
+    Args:
+        h3_index: The H3 index of the tile
+        hex_maps_dir: The directory holding the tile's map images
+        dir_mtime: Modification time of the directory, used as part of the cache key
+        
+    Returns:
+        The absolute file path for the most recent hex map PNG file, or None
+    """
+    # Look for timestamped map files in a single pass; the newest has the greatest timestamp
+    prefix = f"{h3_index}_"
+    min_length = len(prefix) + len(".png")
+    default_name = f"{h3_index}.png"
+    latest_name = None
+    has_default = False
+    with os.scandir(hex_maps_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name == default_name:
+                has_default = True
+            elif (name.startswith(prefix) and name.endswith(".png") and len(name) >= min_length
+                    and (latest_name is None or name > latest_name)):
+                latest_name = name
+    
+    if latest_name is not None:
+        return os.path.join(hex_maps_dir, latest_name)
     
-    # Check for a non-timestamped file
-    default_path = get_hex_map_path(h3_index)
-    if os.path.exists(default_path):
-        return default_path
+    # Fall back to a non-timestamped file
+    if has_default:
+        return os.path.join(hex_maps_dir, default_name)
     
     # No map file found
     return None
 
-class VisualProperties(BaseModel):
+@functools.lru_cache(maxsize=1)
+def _load_hex_map_renderer() -> Optional[Callable[[str, str], Any]]:
+    """
+    Import the render function of the hex map generation script.
+    
+    Returns:
+        The script's render_hex_map function, or None if the script can't be
+        imported here, e.g. because its dependencies are not installed
+    """
+    try:
+        spec = importlib.util.spec_from_file_location("generate_hex_map", _HEX_MAP_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.render_hex_map
+    except Exception as e:
+        # Cached like a successful import, so the subprocess is used from now on
+        logger.info("Hex maps will be generated in a subprocess, the renderer can't be imported: %s", e)
+        return None
+
+def _encode_json(data: Dict) -> bytes:
+    """
+    Encode data as indented JSON for a data file, using orjson when available.
+    
+    Args:
+        data: The data to encode
+        
+    Returns:
+        The encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects some values json accepts (e.g. integers over 64 bits)
+            pass
+    return json.dumps(data, indent=2).encode()
+
+def _create_temp_file(path: str) -> Tuple[int, str]:
+    """
+    Create a temporary file next to a data file, creating its directory if needed.
+    
+    Directories that were created before are remembered, so writes into the
+    same directory skip the makedirs syscalls. The file gets the same
+    permissions as a file created with open().
+    
+    Args:
+        path: The path of the file that is about to be written
+        
+    Returns:
+        The open file descriptor and the path of the temporary file
+    """
+    directory = os.path.dirname(path)
+    if directory not in _KNOWN_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _KNOWN_DIRS.add(directory)
+    while True:
+        tmp_path = f"{path}.{os.getpid()}.{next(_TEMP_FILE_COUNTER)}.tmp"
+        try:
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_path
+        except FileExistsError:
+            # Left behind by an earlier process with the same pid
+            continue
+        except FileNotFoundError:
+            # The directory was removed after it was created
+            os.makedirs(directory, exist_ok=True)
+
+def _write_fd(fd: int, data: bytes) -> None:
+    """
+    Write all data to a file descriptor and close it.
+    
+    Args:
+        fd: The open file descriptor
+        data: The full contents of the file
+    """
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """
+    Atomically write a file, creating its directory if needed.
+    
+    The data is written to a temporary file next to the target and moved into
+    place, so readers never see a partially written file.
+    
+    Args:
+        path: The path of the file
+        data: The full contents of the file
+    """
+    fd, tmp_path = _create_temp_file(path)
+    try:
+        _write_fd(fd, data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def _load_json(path: str) -> Optional[Dict]:
+    """
+    Load a JSON data file, reusing the parsed data while the file is unchanged.
+    
+    The file's stat signature is part of the cache key, so any write to the
+    file (including the atomic replace used for dynamic data) invalidates it.
+    Callers must not modify the returned data.
+    
+    Args:
+        path: The path of the JSON file
+        
+    Returns:
+        The parsed data, or None if the file does not exist
+    """
+    signature = _file_signature(path)
+    if signature is None:
+        return None
+    return _read_json(path, *signature)
+
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Get the stat signature used to key the caches of data read from a file.
+    
+    Args:
+        path: The path of the file
+        
+    Returns:
+        The (mtime_ns, size, inode) of the file, or None if it does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+def _is_stored(path: str, data: Dict) -> bool:
+    """
+    Check whether a JSON file already holds exactly the given data.
+    
+    Args:
+        path: The path of the JSON file
+        data: The data that is about to be written
+        
+    Returns:
+        True if the file exists and its parsed contents equal the data
+    """
+    try:
+        return _load_json(path) == data
+    except ValueError:
+        # Unreadable files are simply rewritten
+        return False
+
+@functools.lru_cache(maxsize=16384)
+def _read_json(path: str, mtime_ns: int, size: int, inode: int) -> Dict:
+    """
+    Read and parse a JSON file; cached per path and stat signature.
+    
+    Args:
+        path: The path of the JSON file
+        mtime_ns: Modification time of the file, used as part of the cache key
+        size: Size of the file, used as part of the cache key
+        inode: Inode of the file, used as part of the cache key
+        
+    Returns:
+        The parsed data
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@dataclass(slots=True)
+class VisualProperties:
     """Visual properties for a tile."""
     border_color: str = "#000000"
     border_thickness: int = 1
     border_style: str = "solid"
     fill_color: str = "#FFFFFF"
     fill_opacity: float = 0.5
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VisualProperties":
+        """Creates visual properties from stored data, ignoring unknown properties."""
+        return cls(**{name: value for name, value in data.items() if name in _VISUAL_PROPERTY_NAMES})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the visual properties to a dictionary for JSON serialization."""
+        return {
+            "border_color": self.border_color,
+            "border_thickness": self.border_thickness,
+            "border_style": self.border_style,
+            "fill_color": self.fill_color,
+            "fill_opacity": self.fill_opacity
+        }
+    
+    def copy(self) -> "VisualProperties":
+        """Create a copy of the visual properties."""
+        return replace(self)
+
+_VISUAL_PROPERTY_NAMES = frozenset(prop.name for prop in fields(VisualProperties))
+
+# Default visual properties to compare against; never modified
+_DEFAULT_VISUAL_PROPERTIES = VisualProperties()
+
+class VisualPropertiesUpdate(BaseModel):
+    """
+    Partial update of a tile's visual properties.
+    
+    Unknown properties are ignored, and so are properties set to null.
+    """
+    border_color: Optional[str] = None
+    border_thickness: Optional[int] = None
+    border_style: Optional[str] = None
+    fill_color: Optional[str] = None
+    fill_opacity: Optional[float] = None
 
-class TileData(BaseModel):
-    """Data model for tile storage."""
-    id: str
+class TileUpdate(BaseModel):
+    """Request body for updating a tile's content and/or visual properties."""
     content: Optional[str] = None
-    visual_properties: VisualProperties = VisualProperties()
-    parent_id: Optional[str] = None
-    children_ids: List[str] = []
-    neighbor_ids: Dict[str, str] = {}  # Changed from List to Dict for position-based neighbors
-    resolution_ids: Dict[str, str] = {}  # New field for different resolution IDs (resolution -> h3 index)
-    resolution: int = 0  # Current resolution level of the tile
+    visual_properties: Optional[VisualPropertiesUpdate] = None
 
 class Tile(ABC):
     """Base class for all tiles."""
     
+    # Neighbor position labels in clockwise order; neighbor_ids is a tuple
+    # aligned with these, with "pentagon" marking the missing pentagon neighbor
+    NEIGHBOR_POSITIONS = (
+        "bottom_middle",  # Starting position (reference vertex is at bottom-middle)
+        "bottom_left",
+        "top_left",
+        "top_middle",
+        "top_right",
+        "bottom_right"
+    )
+    
     def __init__(self, id: str, content: Optional[str] = None):
         """Initialize a tile with an H3 index ID."""
         self.id = id
         self.content = content
         self.visual_properties = VisualProperties()
         
-        # Get parent and children from H3
+        # Get grid information from H3; parent_id, children_ids and resolution_ids
+        # are looked up on first access
         try:
             # Get the resolution of the current tile
             self.resolution = h3.h3_get_resolution(id)
-            logger.info(f"Initializing tile {id} with resolution {self.resolution}")
-            
-            self.parent_id = h3.h3_to_parent(id, self.resolution - 1) if self.resolution > 0 else None
-            
-            # Only get children if we're not at max resolution
-            if self.resolution < 15:
-                self.children_ids = list(h3.h3_to_children(id, self.resolution + 1))
-            else:
-                logger.info(f"Tile {id} is at max resolution 15, no children available")
-                self.children_ids = []
+            logger.debug("Initializing tile %s with resolution %s", id, self.resolution)
             
             # Get neighbor IDs with position labels
             self.neighbor_ids = self._get_positioned_neighbors(id)
             
-            # Get different resolution IDs for all resolutions (0-15)
-            self.resolution_ids = {}
-            current_res = self.resolution
-            logger.info(f"Current resolution: {current_res}")
-            
-            # Get geographic coordinates of this location
-            lat, lng = h3.h3_to_geo(id)
-            logger.info(f"Calculating all resolution IDs for location ({lat}, {lng})")
-            
-            # Calculate IDs for all resolutions (0-15)
-            for res in range(16):  # H3 supports resolutions 0-15
-                if res == current_res:
-                    # For current resolution, use the existing ID
-                    self.resolution_ids[str(res)] = id
-                else:
-                    # For other resolutions, calculate the ID at this location
-                    logger.info(f"Calculating resolution {res} ID")
-                    self.resolution_ids[str(res)] = h3.geo_to_h3(lat, lng, res)
-            
         except ValueError as e:
-            logger.error(f"Error initializing tile {id}: {str(e)}")
+            logger.error("Error initializing tile %s: %s", id, e)
             self.parent_id = None
             self.children_ids = []
-            self.neighbor_ids = {}  # Changed from list to empty dict
-            self.resolution_ids = {}
+            self.neighbor_ids = ()
+            self.resolution_ids = ()
+    
+    @functools.cached_property
+    def parent_id(self) -> Optional[str]:
+        """The H3 index of the parent tile, looked up on first access."""
+        return _h3_parent(self.id)
     
-    def _get_positioned_neighbors(self, tile_id: str) -> Dict[str, str]:
+    @functools.cached_property
+    def children_ids(self) -> List[str]:
+        """The H3 indexes of the child tiles, looked up on first access."""
+        # Only get children if we're not at max resolution
+        if self.resolution < 15:
+            return list(_h3_children(self.id))
+        logger.debug("Tile %s is at max resolution 15, no children available", self.id)
+        return []
+    
+    @functools.cached_property
+    def resolution_ids(self) -> Tuple[str, ...]:
+        """The H3 indexes at this location for all resolutions (0-15), looked up on first access."""
+        return _h3_resolution_ids(self.id)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=65536)
+    def _get_positioned_neighbors(cls, tile_id: str) -> Tuple[str, ...]:
         """
-        Get neighbor IDs as a dictionary mapping position labels to H3 indexes.
+        Get neighbor IDs ordered by position label; cached per H3 index.
         
         For hexagons with flat edge at bottom:
-        - Keys: top_left, top_middle, top_right, bottom_left, bottom_middle, bottom_right
+        - One H3 index per entry of NEIGHBOR_POSITIONS
         
         For pentagons:
         - Similar approach but with 5 neighbors, with one position set to 'pentagon'
         """
-        # Get all neighbors
-        neighbors = h3.k_ring(tile_id, 1)
-        neighbors = [idx for idx in neighbors if idx != tile_id]
+        # Get all neighbors; hex_ring can fail near pentagons, k_ring always works
+        try:
+            neighbors = h3.hex_ring(tile_id, 1)
+        except ValueError:
+            neighbors = [idx for idx in h3.k_ring(tile_id, 1) if idx != tile_id]
         
         # Get center coordinates of the tile
-        center_lat, center_lng = h3.h3_to_geo(tile_id)
+        center_lat, center_lng = _h3_to_geo(tile_id)
         
         # Get boundary vertices
-        boundary = h3.h3_to_geo_boundary(tile_id)
+        boundary = _h3_boundary(tile_id)
         
         # Determine if we're in northern or southern hemisphere
         in_northern_hemisphere = center_lat > 0
         
-        # Find the edge closest to the equator
-        min_lat_diff = float('inf')
-        equator_edge_idx = 0
-        
-        for i in range(len(boundary)):
-            next_i = (i + 1) % len(boundary)
-            edge_lat = (boundary[i][0] + boundary[next_i][0]) / 2  # Average latitude of the edge
-            lat_diff = abs(edge_lat)  # Distance from equator
-            
-            if lat_diff < min_lat_diff:
-                min_lat_diff = lat_diff
-                equator_edge_idx = i
+        # Find the edge closest to the equator, i.e. with the smallest absolute average latitude
+        vertex_lats = [lat for lat, _ in boundary]
+        edge_lat_diffs = [abs(lat + next_lat) / 2 for lat, next_lat in zip(vertex_lats, vertex_lats[1:] + vertex_lats[:1])]
+        equator_edge_idx = edge_lat_diffs.index(min(edge_lat_diffs))
         
         # Determine reference vertex based on hemisphere
         if in_northern_hemisphere:
@@ -250,91 +559,70 @@ class Tile(ABC):
             # For southern hemisphere, use the right vertex of top edge as reference
             ref_vertex_idx = equator_edge_idx
         
-        # Get reference vertex coordinates
-        ref_lat, ref_lng = boundary[ref_vertex_idx]
-        
-        # Calculate bearing from center to reference vertex
-        ref_bearing = self._calculate_bearing(center_lat, center_lng, ref_lat, ref_lng)
+        # Calculate the bearings from the center to the reference vertex and to
+        # the center of each neighbor in one batch
+        ref_bearing, *bearings = cls._calculate_bearings(
+            center_lat, center_lng, [boundary[ref_vertex_idx]] + [_h3_to_geo(n_id) for n_id in neighbors])
         
-        # Get center coordinates of each neighbor
-        neighbor_bearings = []
-        for n_id in neighbors:
-            n_lat, n_lng = h3.h3_to_geo(n_id)
-            bearing = self._calculate_bearing(center_lat, center_lng, n_lat, n_lng)
-            
-            # Adjust bearing relative to reference bearing
-            rel_bearing = (bearing - ref_bearing) % 360
-            neighbor_bearings.append((n_id, rel_bearing))
+        # Adjust bearings relative to reference bearing
+        neighbor_bearings = [(n_id, (bearing - ref_bearing) % 360) for n_id, bearing in zip(neighbors, bearings)]
         
         # Sort neighbors by relative bearing (clockwise)
         neighbor_bearings.sort(key=lambda x: x[1])
         
         # For a flat-bottom hexagon, map the neighbors to positions
-        # The positions are assigned clockwise starting from the reference point
-        is_pentagon = h3.h3_is_pentagon(tile_id)
-        num_neighbors = 5 if is_pentagon else 6
-        
-        # Define position names in clockwise order
-        position_names = [
-            "bottom_middle",  # Starting position (reference vertex is at bottom-middle)
-            "bottom_left", 
-            "top_left", 
-            "top_middle", 
-            "top_right", 
-            "bottom_right"
-        ]
-        
-        # Map neighbors to positions
-        positioned_neighbors = {}
-        for i, (n_id, _) in enumerate(neighbor_bearings):
-            if i < len(position_names):
-                positioned_neighbors[position_names[i]] = n_id
-        
-        # For pentagons, identify the missing position and mark it
-        if is_pentagon:
-            for position in position_names:
-                if position not in positioned_neighbors:
-                    positioned_neighbors[position] = "pentagon"
-                    break
+        # The positions (NEIGHBOR_POSITIONS) are assigned clockwise starting from the reference point
+        positioned_neighbors = tuple(n_id for n_id, _ in neighbor_bearings[:len(cls.NEIGHBOR_POSITIONS)])
+        
+        # A pentagon has five neighbors, so its last position is the one left to mark
+        if _h3_is_pentagon(tile_id):
+            positioned_neighbors += ("pentagon",)
         
         return positioned_neighbors
     
-    def _calculate_bearing(self, lat1, lng1, lat2, lng2):
+    @staticmethod
+    def _calculate_bearings(lat1, lng1, points):
         """
-        Calculate the bearing from point 1 to point 2.
-        All angles in radians.
+        Calculate the bearings from point 1 to each of the given points.
+        All angles in degrees; the trigonometry of point 1 is only done once.
         """
         # Convert to radians
-        lat1, lng1, lat2, lng2 = map(math.radians, [lat1, lng1, lat2, lng2])
+        lat1, lng1 = math.radians(lat1), math.radians(lng1)
+        sin_lat1, cos_lat1 = math.sin(lat1), math.cos(lat1)
         
-        # Calculate bearing
-        y = math.sin(lng2 - lng1) * math.cos(lat2)
-        x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(lng2 - lng1)
-        bearing = math.atan2(y, x)
-        
-        # Convert to degrees
-        bearing = math.degrees(bearing)
-        
-        # Normalize to 0-360
-        bearing = (bearing + 360) % 360
+        bearings = []
+        for lat2, lng2 in points:
+            lat2, lng2 = math.radians(lat2), math.radians(lng2)
+            cos_lat2 = math.cos(lat2)
+            
+            # Calculate bearing
+            y = math.sin(lng2 - lng1) * cos_lat2
+            x = cos_lat1 * math.sin(lat2) - sin_lat1 * cos_lat2 * math.cos(lng2 - lng1)
+            
+            # Convert to degrees and normalize to 0-360
+            bearings.append((math.degrees(math.atan2(y, x)) + 360) % 360)
         
-        return bearing
+        return bearings
     
     def get_neighbors(self) -> List["Tile"]:
         """Returns neighboring tiles."""
-        # Create appropriate tile objects based on the type
-        neighbors = []
-        for position, idx in self.neighbor_ids.items():
-            if idx == "pentagon":  # Skip pentagon placeholders
-                continue
-            if h3.h3_is_pentagon(idx):
-                neighbors.append(PentagonTile(idx))
-            else:
-                neighbors.append(HexagonTile(idx))
-        return neighbors
+        # Create appropriate tile objects based on the type, skipping pentagon placeholders
+        return [make_tile(idx) for idx in self.neighbor_ids if idx != "pentagon"]
     
-    def move_content_to(self, target_tile: "Tile") -> bool:
-        """Move content to another tile."""
+    def move_content_to(self, target_tile: "Tile", mod_name: str = "default") -> bool:
+        """
+        Move content to another tile.
+        
+        Only the dynamic data changes, so both tiles' dynamic data is saved
+        together in one batch; their static data is expected to be stored already.
+        
+        Args:
+            target_tile: The tile to move the content to
+            mod_name: The name of the mod/application (default: "default")
+            
+        Returns:
+            True if the content was moved
+        """
         # No longer checking if target is a neighbor - allow moving to any tile
         
         if target_tile is None:
@@ -344,8 +632,7 @@ class Tile(ABC):
         self.content = None
         
         # Save both tiles
-        self.save()
-        target_tile.save()
+        Tile.save_dynamic_many([self, target_tile], mod_name)
         
         return True
     
@@ -354,40 +641,82 @@ class Tile(ABC):
         if self.parent_id is None:
             return None
         
-        if h3.h3_is_pentagon(self.parent_id):
-            return PentagonTile(self.parent_id)
-        else:
-            return HexagonTile(self.parent_id)
+        return make_tile(self.parent_id)
     
     def get_children(self) -> List["Tile"]:
         """Returns child tiles."""
-        children = []
-        for child_id in self.children_ids:
-            if h3.h3_is_pentagon(child_id):
-                children.append(PentagonTile(child_id))
-            else:
-                children.append(HexagonTile(child_id))
-        
-        return children
+        return [make_tile(child_id) for child_id in self.children_ids]
+    
+    def neighbor_ids_dict(self) -> Dict[str, str]:
+        """Returns the neighbor IDs as a dictionary keyed by position label."""
+        return dict(zip(self.NEIGHBOR_POSITIONS, self.neighbor_ids))
+    
+    @classmethod
+    def neighbor_ids_from_dict(cls, neighbor_ids: Dict[str, str]) -> Tuple[str, ...]:
+        """Converts a position-keyed neighbor dictionary to the positional tuple."""
+        if not neighbor_ids:
+            return ()
+        return tuple(neighbor_ids[position] for position in cls.NEIGHBOR_POSITIONS)
+    
+    def resolution_ids_dict(self) -> Dict[str, str]:
+        """Returns the resolution IDs as a dictionary keyed by resolution."""
+        return dict(zip(_RESOLUTION_KEYS, self.resolution_ids))
+    
+    @classmethod
+    def resolution_ids_from_dict(cls, resolution_ids: Dict[str, str]) -> Tuple[str, ...]:
+        """Converts a resolution-keyed dictionary to the positional tuple."""
+        if not resolution_ids:
+            return ()
+        return tuple(resolution_ids[key] for key in _RESOLUTION_KEYS)
     
     def set_visual_property(self, property_name: str, value: Union[str, int, float]) -> bool:
         """Sets a visual property."""
-        if not hasattr(self.visual_properties, property_name):
+        if property_name not in _VISUAL_PROPERTY_NAMES:
             return False
         
         setattr(self.visual_properties, property_name, value)
         return True
     
+    def apply_visual_properties(self, update: VisualPropertiesUpdate) -> bool:
+        """
+        Applies the visual properties that were set in a partial update.
+        
+        Properties set to null are skipped, since every visual property
+        needs a value.
+        
+        Args:
+            update: The validated visual properties update
+            
+        Returns:
+            True if at least one property was set, False otherwise
+        """
+        changes = update.model_dump(exclude_unset=True, exclude_none=True)
+        for prop_name, value in changes.items():
+            setattr(self.visual_properties, prop_name, value)
+        return bool(changes)
+    
+    def apply(self, update: TileUpdate) -> None:
+        """
+        Applies a validated tile update to the tile.
+        
+        Args:
+            update: The tile update; only the fields it sets are applied
+        """
+        if "content" in update.model_fields_set:
+            self.content = update.content
+        if update.visual_properties is not None:
+            self.apply_visual_properties(update.visual_properties)
+    
     def to_dict(self) -> Dict:
         """Convert tile to dictionary for JSON serialization."""
         return {
             "id": self.id,
             "content": self.content,
-            "visual_properties": self.visual_properties.dict(),
+            "visual_properties": self.visual_properties.to_dict(),
             "parent_id": self.parent_id,
-            "children_ids": list(self.children_ids) if isinstance(self.children_ids, set) else self.children_ids,
-            "neighbor_ids": self.neighbor_ids,  # Now a dictionary with position keys
-            "resolution_ids": self.resolution_ids,
+            "children_ids": self.children_ids,
+            "neighbor_ids": self.neighbor_ids_dict(),
+            "resolution_ids": self.resolution_ids_dict(),
             "resolution": self.resolution
         }
     
@@ -396,9 +725,9 @@ class Tile(ABC):
         return {
             "id": self.id,
             "parent_id": self.parent_id,
-            "children_ids": list(self.children_ids) if isinstance(self.children_ids, set) else self.children_ids,
-            "neighbor_ids": self.neighbor_ids,
-            "resolution_ids": self.resolution_ids,
+            "children_ids": self.children_ids,
+            "neighbor_ids": self.neighbor_ids_dict(),
+            "resolution_ids": self.resolution_ids_dict(),
             "resolution": self.resolution
         }
     
@@ -407,7 +736,7 @@ class Tile(ABC):
         return {
             "id": self.id,
             "content": self.content,
-            "visual_properties": self.visual_properties.dict()
+            "visual_properties": self.visual_properties.to_dict()
         }
     
     def save(self) -> None:
@@ -418,7 +747,7 @@ class Tile(ABC):
         and dynamic data only when needed.
         """
         try:
-            logger.info(f"Saving tile {self.id}")
+            logger.debug("Saving tile %s", self.id)
             
             # Save static data (always)
             self.save_static()
@@ -426,10 +755,10 @@ class Tile(ABC):
             # Save dynamic data (only if needed)
             self.save_dynamic()
             
-            logger.info(f"Successfully saved tile {self.id}")
+            logger.debug("Successfully saved tile %s", self.id)
                 
         except Exception as e:
-            logger.error(f"Error saving tile {self.id}: {str(e)}")
+            logger.error("Error saving tile %s: %s", self.id, e)
             raise
     
     def save_static(self) -> None:
@@ -437,23 +766,42 @@ class Tile(ABC):
         Persists static tile data to storage.
         Static data includes H3 grid information that doesn't change.
         """
+        self.save_static_many([self])
+    
+    @classmethod
+    def save_static_many(cls, tiles: List["Tile"]) -> None:
+        """
+        Persists the static data of several tiles in one batch.
+        
+        Each tile's JSON is encoded up front and written atomically with a
+        single write; the files of a batch are written concurrently on the
+        shared I/O pool.
+        
+        Args:
+            tiles: The tiles to save
+        """
         try:
-            # Save static data
-            static_path = get_static_path(self.id)
-            logger.info(f"Saving static data for tile {self.id} to {static_path}")
+            static_paths = [get_static_path(tile.id) for tile in tiles]
+            static_json = [_encode_json(tile.to_static_dict()) for tile in tiles]
             
-            static_data = self.to_static_dict()
-            os.makedirs(os.path.dirname(static_path), exist_ok=True)
-            
-            with open(static_path, 'w') as f:
-                json.dump(static_data, f, indent=2)
-            
-            logger.info(f"Successfully saved static data for tile {self.id}")
+            write_all = map if len(tiles) <= 1 else _IO_EXECUTOR.map
+            for tile, static_path, _ in zip(tiles, static_paths, write_all(_write_bytes, static_paths, static_json)):
+                logger.debug("Successfully saved static data for tile %s to %s", tile.id, static_path)
     
         except Exception as e:
-            logger.error(f"Error saving static data for tile {self.id}: {str(e)}")
+            logger.error("Error saving static data for tiles %s: %s", [tile.id for tile in tiles], e)
             raise
     
+    def has_dynamic_data(self) -> bool:
+        """Returns True if the tile has content or non-default visual properties."""
+        # Check if there's any content
+        has_content = self.content is not None and self.content.strip() != ""
+        
+        # Check if any visual property is different from default
+        has_custom_visuals = self.visual_properties != _DEFAULT_VISUAL_PROPERTIES
+        
+        return has_content or has_custom_visuals
+    
     def save_dynamic(self, mod_name: str = "default") -> None:
         """
         Persists dynamic tile data to storage.
@@ -463,47 +811,62 @@ class Tile(ABC):
         Args:
             mod_name: The name of the mod/application (default: "default")
         """
+        self.save_dynamic_many([self], mod_name)
+    
+    @classmethod
+    def save_dynamic_many(cls, tiles: List["Tile"], mod_name: str = "default") -> None:
+        """
+        Persists the dynamic data of several tiles as one batch.
+        
+        Every file is first written to a temporary file next to it and only
+        moved into place once all of them were written, so a failure part-way
+        leaves the previous data of every tile intact.
+        
+        Args:
+            tiles: The tiles to save
+            mod_name: The name of the mod/application (default: "default")
+        """
+        # (tile, dynamic path, temporary file or None when the file should be removed)
+        staged = []
         try:
-            # Check if there's any content or non-default visual properties
-            has_content = self.content is not None and self.content.strip() != ""
-            
-            # Create a default visual properties object for comparison
-            default_visual_props = VisualProperties()
-            
-            # Check if any visual property is different from default
-            has_custom_visuals = False
-            for prop_name, prop_value in self.visual_properties.dict().items():
-                default_value = getattr(default_visual_props, prop_name)
-                if prop_value != default_value:
-                    has_custom_visuals = True
-                    break
-            
-            # Only save if there's content or custom visual properties
-            if has_content or has_custom_visuals:
-                # Get the dynamic path
-                dynamic_path = get_dynamic_path(self.id, mod_name)
-                logger.info(f"Saving dynamic data for tile {self.id} to {dynamic_path}")
+            for tile in tiles:
+                dynamic_path = get_dynamic_path(tile.id, mod_name)
                 
-                # Create directories only when we're actually saving data
-                os.makedirs(os.path.dirname(dynamic_path), exist_ok=True)
-                
-                dynamic_data = self.to_dynamic_dict()
-                
-                with open(dynamic_path, 'w') as f:
-                    json.dump(dynamic_data, f, indent=2)
-                
-                logger.info(f"Successfully saved dynamic data for tile {self.id}")
-            else:
-                logger.info(f"No content or custom visual properties for tile {self.id}, skipping dynamic data save")
-                
-                # Check if a dynamic file already exists and delete it if it does
-                dynamic_path = get_dynamic_path(self.id, mod_name)
-                if os.path.exists(dynamic_path):
-                    logger.info(f"Removing empty dynamic data file for tile {self.id}")
+                # Only save if there's content or custom visual properties
+                if tile.has_dynamic_data():
+                    dynamic_data = tile.to_dynamic_dict()
+                    
+                    # Repeated updates often carry the same values, so don't rewrite an unchanged file
+                    if _is_stored(dynamic_path, dynamic_data):
+                        logger.debug("Dynamic data for tile %s is unchanged, skipping write", tile.id)
+                        continue
+                    
+                    logger.debug("Saving dynamic data for tile %s to %s", tile.id, dynamic_path)
+                    
+                    # Directories are only created when we're actually saving data
+                    fd, tmp_path = _create_temp_file(dynamic_path)
+                    staged.append((tile, dynamic_path, tmp_path))
+                    _write_fd(fd, _encode_json(dynamic_data))
+                else:
+                    logger.debug("No content or custom visual properties for tile %s, skipping dynamic data save", tile.id)
+                    staged.append((tile, dynamic_path, None))
+            
+            # Swap the new files in (or drop empty ones) now that every write succeeded
+            for tile, dynamic_path, tmp_path in staged:
+                if tmp_path is not None:
+                    os.replace(tmp_path, dynamic_path)
+                    logger.debug("Successfully saved dynamic data for tile %s", tile.id)
+                elif os.path.exists(dynamic_path):
+                    # A dynamic file already exists, so delete it
+                    logger.debug("Removing empty dynamic data file for tile %s", tile.id)
                     os.remove(dynamic_path)
             
         except Exception as e:
-            logger.error(f"Error saving dynamic data for tile {self.id}: {str(e)}")
+            logger.error("Error saving dynamic data for tiles %s: %s", [tile.id for tile in tiles], e)
+            # Clean up temporary files that were not moved into place
+            for _, _, tmp_path in staged:
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
             raise
     
     def generate_hex_map(self) -> None:
@@ -522,21 +885,21 @@ class Tile(ABC):
             # Get the path for the hex map with timestamp, and create directories
             hex_map_path = get_hex_map_path(self.id, timestamp, create_dirs=True)
             
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(hex_map_path), exist_ok=True)
+            logger.info("Generating hex map for tile %s with timestamp %s", self.id, timestamp)
             
-            # Path to the generate_hex_map.py script
-            script_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 
-                "frontend", "assets", "generate_hex_map.py"
-            )
+            # Render in this process when the script's dependencies are available here,
+            # which saves starting a new interpreter for every map
+            render_hex_map = _load_hex_map_renderer()
+            if render_hex_map is not None:
+                render_hex_map(self.id, hex_map_path)
+                logger.info("Successfully generated hex map for tile %s", self.id)
+                return
             
             # Run the script to generate the hex map
-            logger.info(f"Generating hex map for tile {self.id} with timestamp {timestamp}")
             result = subprocess.run(
                 [
                     "python", 
-                    script_path, 
+                    _HEX_MAP_SCRIPT, 
                     "--h3_index", self.id, 
                     "--output", hex_map_path
                 ],
@@ -545,12 +908,12 @@ class Tile(ABC):
             )
             
             if result.returncode == 0:
-                logger.info(f"Successfully generated hex map for tile {self.id}")
+                logger.info("Successfully generated hex map for tile %s", self.id)
             else:
-                logger.error(f"Error generating hex map for tile {self.id}: {result.stderr}")
+                logger.error("Error generating hex map for tile %s: %s", self.id, result.stderr)
                 
         except Exception as e:
-            logger.error(f"Error generating hex map for tile {self.id}: {str(e)}")
+            logger.error("Error generating hex map for tile %s: %s", self.id, e)
             # Don't raise the exception, as this is not critical for tile saving
     
     @classmethod
@@ -568,9 +931,51 @@ class Tile(ABC):
         try:
             return cls.load_from_split_files(tile_id, mod_name)
         except Exception as e:
-            logger.error(f"Error loading tile {tile_id}: {str(e)}")
+            logger.error("Error loading tile %s: %s", tile_id, e)
             return None
     
+    @classmethod
+    def existing_ids(cls, tile_ids: Iterable[str]) -> Set[str]:
+        """
+        Find which tiles already have their static data in storage.
+        
+        Only checks that the static file exists, without reading or parsing
+        it, which is much cheaper than probing with load(). Static data is
+        shared by all mods.
+        
+        Args:
+            tile_ids: The H3 indexes of the tiles to check
+            
+        Returns:
+            The set of H3 indexes whose static data is stored
+        """
+        return {tile_id for tile_id in tile_ids if os.path.exists(get_static_path(tile_id))}
+    
+    @classmethod
+    def load_many(cls, tile_ids: List[str], mod_name: str = "default") -> Dict[str, "Tile"]:
+        """
+        Load several tiles from storage in one batch.
+        
+        The reads are issued together on a shared thread pool so the
+        filesystem latency of each tile overlaps with the others.
+        
+        Args:
+            tile_ids: The H3 indexes of the tiles to load
+            mod_name: The name of the mod/application (default: "default")
+            
+        Returns:
+            A dictionary mapping each H3 index found in storage to its loaded tile
+        """
+        # Drop duplicates while keeping the requested order
+        unique_ids = list(dict.fromkeys(tile_ids))
+        
+        if len(unique_ids) <= 1:
+            tiles = (cls.load(tile_id, mod_name) for tile_id in unique_ids)
+        else:
+            tiles = _IO_EXECUTOR.map(lambda tile_id: cls.load(tile_id, mod_name), unique_ids)
+        
+        return {tile_id: tile for tile_id, tile in zip(unique_ids, tiles) if tile is not None}
+    
     @classmethod
     def load_from_split_files(cls, tile_id: str, mod_name: str = "default") -> Optional["Tile"]:
         """
@@ -586,45 +991,84 @@ class Tile(ABC):
         static_path = get_static_path(tile_id)
         dynamic_path = get_dynamic_path(tile_id, mod_name)
         
-        # Check if at least the static file exists
-        if not os.path.exists(static_path):
-            logger.info(f"Static data file not found for tile {tile_id}")
+        # At least the static file must exist
+        static_signature = _file_signature(static_path)
+        if static_signature is None:
+            logger.debug("Static data file not found for tile %s", tile_id)
             return None
         
         try:
-            # Load static data
-            with open(static_path, 'r') as f:
-                static_data = json.load(f)
-            
-            # Create the appropriate tile type
-            if h3.h3_is_pentagon(tile_id):
-                tile = PentagonTile(tile_id)
-            else:
-                tile = HexagonTile(tile_id)
-            
-            # Load static data
-            tile.parent_id = static_data.get("parent_id")
-            tile.children_ids = static_data.get("children_ids", [])
-            tile.neighbor_ids = static_data.get("neighbor_ids", {})
-            tile.resolution_ids = static_data.get("resolution_ids", {})
-            tile.resolution = static_data.get("resolution", h3.h3_get_resolution(tile_id))
-            
-            # Try to load dynamic data if it exists
-            if os.path.exists(dynamic_path):
-                with open(dynamic_path, 'r') as f:
-                    dynamic_data = json.load(f)
-                
-                # Load dynamic data
-                tile.content = dynamic_data.get("content")
-                
-                if "visual_properties" in dynamic_data:
-                    tile.visual_properties = VisualProperties(**dynamic_data["visual_properties"])
-            
-            return tile
-            
+            tile = cls._load_cached(tile_id, static_path, static_signature,
+                                    dynamic_path, _file_signature(dynamic_path))
         except Exception as e:
-            logger.error(f"Error loading tile {tile_id} from split files: {str(e)}")
+            logger.error("Error loading tile %s from split files: %s", tile_id, e)
             return None
+        
+        # Hand out a copy, callers are free to modify the tile they get
+        return tile.copy()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _load_cached(tile_id: str,
+                     static_path: str, static_signature: Tuple[int, int, int],
+                     dynamic_path: str, dynamic_signature: Optional[Tuple[int, int, int]]) -> "Tile":
+        """
+        Build a tile from its data files; cached per file stat signatures.
+        
+        Saving a tile changes the signature of the files it writes, so a
+        saved tile is rebuilt on the next load. The returned tile is shared
+        through the cache and must not be modified.
+        
+        Args:
+            tile_id: The H3 index of the tile
+            static_path: The path of the static data file
+            static_signature: Stat signature of the static data file
+            dynamic_path: The path of the dynamic data file
+            dynamic_signature: Stat signature of the dynamic data file, or None if it does not exist
+            
+        Returns:
+            The loaded tile
+        """
+        static_data = _read_json(static_path, *static_signature)
+        
+        # Create the appropriate tile type without running the constructor,
+        # the stored data already holds everything it would compute
+        tile_cls = _tile_class(tile_id)
+        tile = tile_cls.__new__(tile_cls)
+        tile.id = tile_id
+        tile.content = None
+        tile.visual_properties = VisualProperties()
+        
+        # Load static data
+        tile.parent_id = static_data.get("parent_id")
+        # Copy the list, the parsed data is shared through the cache
+        tile.children_ids = list(static_data.get("children_ids", []))
+        tile.neighbor_ids = Tile.neighbor_ids_from_dict(static_data.get("neighbor_ids", {}))
+        tile.resolution_ids = Tile.resolution_ids_from_dict(static_data.get("resolution_ids", {}))
+        tile.resolution = static_data.get("resolution", h3.h3_get_resolution(tile_id))
+        
+        # Load dynamic data if it exists
+        if dynamic_signature is not None:
+            dynamic_data = _read_json(dynamic_path, *dynamic_signature)
+            tile.content = dynamic_data.get("content")
+            
+            if "visual_properties" in dynamic_data:
+                tile.visual_properties = VisualProperties.from_dict(dynamic_data["visual_properties"])
+        
+        return tile
+    
+    def copy(self) -> "Tile":
+        """
+        Create a copy of this tile that can be modified independently.
+        
+        Returns:
+            A new tile of the same type with copies of the mutable attributes
+        """
+        tile = self.__class__.__new__(self.__class__)
+        tile.__dict__.update(self.__dict__)
+        tile.children_ids = list(self.children_ids)
+        tile.visual_properties = self.visual_properties.copy()
+        return tile
     
     @abstractmethod
     def get_geometry(self) -> List[List[float]]:
@@ -637,14 +1081,13 @@ class HexagonTile(Tile):
     
     def __init__(self, id: str, content: Optional[str] = None):
         super().__init__(id, content)
-        if h3.h3_is_pentagon(id):
+        if _h3_is_pentagon(id):
             raise ValueError(f"ID {id} is a pentagon, not a hexagon")
     
     def get_geometry(self) -> List[List[float]]:
         """Returns the geometry of the hexagon as a list of [lat, lng] coordinates."""
-        boundary = h3.h3_to_geo_boundary(self.id)
         # Convert to [lat, lng] format
-        return [[lat, lng] for lat, lng in boundary]
+        return [[lat, lng] for lat, lng in _h3_boundary(self.id)]
 
 
 class PentagonTile(Tile):
@@ -652,11 +1095,32 @@ class PentagonTile(Tile):
     
     def __init__(self, id: str, content: Optional[str] = None):
         super().__init__(id, content)
-        if not h3.h3_is_pentagon(id):
+        if not _h3_is_pentagon(id):
             raise ValueError(f"ID {id} is not a pentagon")
     
     def get_geometry(self) -> List[List[float]]:
         """Returns the geometry of the pentagon as a list of [lat, lng] coordinates."""
-        boundary = h3.h3_to_geo_boundary(self.id)
         # Convert to [lat, lng] format
-        return [[lat, lng] for lat, lng in boundary]
+        return [[lat, lng] for lat, lng in _h3_boundary(self.id)]
+
+
+def make_tile(tile_id: str, content: Optional[str] = None) -> Tile:
+    """
+    Create a tile of the right type for an H3 index; it is not saved.
+    
+    Args:
+        tile_id: The H3 index of the tile
+        content: Optional content of the tile
+        
+    Returns:
+        A PentagonTile for pentagon indexes, otherwise a HexagonTile
+    """
+    tile_cls = _tile_class(tile_id)
+    # The class was picked from the index, so skip the type check of the subclass __init__
+    tile = tile_cls.__new__(tile_cls)
+    Tile.__init__(tile, tile_id, content)
+    return tile
+
+def _tile_class(tile_id: str) -> type:
+    """Returns the tile class for an H3 index."""
+    return PentagonTile if _h3_is_pentagon(tile_id) else HexagonTile
@@ -18,16 +18,12 @@ from PIL import Image, ImageDraw, ImageFont
 from staticmap import StaticMap, Line
 import numpy as np
 import json
+import logging
 import sys
 
-# Import the get_hex_map_path helper function from the tile module
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "backend"))
-try:
-    from hexglobe.models.tile import get_hex_map_path
-except ImportError:
-    print("Warning: Could not import get_hex_map_path from tile module. Using default path.")
-    def get_hex_map_path(h3_index):
-        return f"{h3_index}.png"
+# Diagnostics go through logging, so the backend can render maps in-process
+# without writing to its stdout; main() prints them for command line use
+logger = logging.getLogger(__name__)
 
 # Constants for the image rendering
 CANVAS_SIZE = 1024
@@ -616,8 +612,8 @@ def apply_vertical_scaling_and_skew(image, pixel_vertices):
         resample=Image.BICUBIC
     )
     
-    print(f"Applied vertical scaling with factor: {vertical_scale_factor:.4f} (applied as {applied_vertical_scale:.4f})")
-    print(f"Applied horizontal skew with factor: {skew_factor:.6f}")
+    logger.info("Applied vertical scaling with factor: %.4f (applied as %.4f)", vertical_scale_factor, applied_vertical_scale)
+    logger.info("Applied horizontal skew with factor: %.6f", skew_factor)
     
     return final_image
 
@@ -654,7 +650,7 @@ def create_hexagon_map(h3_index, zoom=None, rotate=True, debug=False, vertical_a
         # Only increase zoom by 1 when using the distance-based calculation (not h3_index)
         if h3_index is None:
             zoom = min(max(zoom + 1, 1), 19)  # Ensure zoom is between 1 and 19
-        print(f"Calculated zoom level: {zoom}")
+        logger.info("Calculated zoom level: %s", zoom)
     
     # Create a static map centered on the hexagon
     m = StaticMap(CANVAS_SIZE, CANVAS_SIZE)
@@ -1023,19 +1019,43 @@ def save_final_image(image, output_path, debug=False):
     
     # Save the final image
     final_image.save(output_path)
-    print(f"Map image saved to {output_path}")
+    logger.info("Map image saved to %s", output_path)
+
+
+def render_hex_map(h3_index, output_path, zoom=None, rotate=True, debug=False, vertical_adjust=True):
+    """
+    Create the hexagon map for an H3 index and save it.
+    
+    This is the entry point for rendering maps without going through the command line.
+    
+    Args:
+        h3_index: H3 index of the tile
+        output_path: Path to save the image to
+        zoom: OpenStreetMap zoom level (default: auto-calculated)
+        rotate: Whether to rotate to flat-bottom orientation
+        debug: Whether to enable debug mode
+        vertical_adjust: Whether to apply the vertical adjustment
+        
+    Returns:
+        The pixel coordinates of the hexagon vertices
+    """
+    image, vertices = create_hexagon_map(h3_index, zoom, rotate, debug, vertical_adjust)
+    save_final_image(image, output_path, debug)
+    return vertices
 
 
 def main():
     """Main function to parse arguments and create the hexagon map."""
     args = parse_arguments()
     
-    # Create the hexagon map
-    image, vertices = create_hexagon_map(args.h3_index, args.zoom, not args.no_rotate, args.debug, not args.no_vertical_adjust)
+    # Show the diagnostics on the console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     # Determine the output path
     output_path = args.output
     if not output_path:
+        # Make the backend package importable when running as a script
+        sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "backend"))
         try:
             # Try to import the get_hex_map_path function from the backend
             from hexglobe.models.tile import get_hex_map_path
@@ -1046,8 +1066,8 @@ def main():
             print("Could not import get_hex_map_path from backend, using default path")
             output_path = os.path.join(os.getcwd(), f"{args.h3_index}.png")
     
-    # Save the final image with reference dots
-    save_final_image(image, output_path, args.debug)
+    # Create the hexagon map and save it with reference dots
+    vertices = render_hex_map(args.h3_index, output_path, args.zoom, not args.no_rotate, args.debug, not args.no_vertical_adjust)
     
     # If vertices flag is set, print the pixel vertices
     if args.vertices: